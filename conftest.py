@@ -0,0 +1 @@
+# Lets the tests under test/ import the modules in the repository root (pytest puts this directory on sys.path)
@@ -1,16 +1,31 @@
 # Copyright © Raoul van Zomeren. All rights reserved.
 # NOTE: pyinstaller "flashcards.py" --onefile --name "flashcards v1.0.1" --noconsole --add-data "languages:languages" --add-data "silence.mp3:."
+# NOTE: optionally seed first runs with a Vakken snapshot: after a run that reached GitHub, extract it from the cache with
+#       python -c "import json; s = json.load(open('vakken_cache.json', encoding='utf-8'))['structure'];
+#                  json.dump(s, open('vakken_structure.json', 'w', encoding='utf-8'), ensure_ascii=False)"
+#       and add --add-data "vakken_structure.json:." to the command above. Without it the app simply starts without a seed.
 from __future__ import annotations
 
 # ------ Imports ------
-import json, logging, os, random, sys, threading, typing, configparser, pygame, requests
+import functools, io, itertools, json, logging, os, random, shutil, sys, threading, time, typing, zipfile, requests
 
 import tkinter as tk
 
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
 from packaging.version import Version
-from pygame import mixer
 from tkinter import ttk, messagebox, filedialog
-from PIL import Image, ImageTk
+
+# Network, JSON, archive and settings helpers live apart from the Tk/network start-up below, so they can be imported by tests
+from flashcards_helpers import (
+    SESSION, conditional_get, convert_settings, download_range, json_dumps, json_loads, parse_vakken_zip,
+    serialize_settings, setdefault_advanced, write_atomic,
+)
+
+# pygame is slow to import, so Menu.setup_music imports it on the mixer thread
+pygame: typing.Any = None
+mixer: typing.Any = None
 
 # ------ Info & Initialization ------
 
@@ -19,15 +34,26 @@ DEV_MODE: bool = False
 PLAYTEST: int = 0  # 0 for release, 1 for first playtest, etc.
 WIDTH, HEIGHT = 800, 600
 VERSION, VERSION_NAME = "1.0.1", "The Launching Update"
+TITLE_SHORT: str = f"Flashcards© v{VERSION}" + (f"-p{PLAYTEST}" if PLAYTEST else "")
+TITLE_STR: str = f"{TITLE_SHORT}: {VERSION_NAME}"
 
 # - Github Info -
 OWNER, REPO, VAKKEN_REPO = "Flashcards-Program", "Flashcards", "Flashcards-Vakken"
 LATEST_JSON_URL: str = f"https://raw.githubusercontent.com/{OWNER}/{REPO}/refs/heads/main/versions.json"
 SPLASH_JSON_URL: str = f"https://raw.githubusercontent.com/{OWNER}/{REPO}/refs/heads/main/splash.json"
+VAKKEN_COMMIT_URL: str = f"https://api.github.com/repos/{OWNER}/{VAKKEN_REPO}/commits/main"
+VAKKEN_ZIP_URL: str = f"https://api.github.com/repos/{OWNER}/{VAKKEN_REPO}/zipball/main"
+VAKKEN_CACHE_PATH: str = "vakken_cache.json"
+VERSIONS_CACHE_PATH: str = "versions_cache.json"
+SPLASH_CACHE_PATH: str = "splash_cache.json"
+CACHE_MAX_AGE: int = 6 * 60 * 60  # seconds a cached versions/splash file is trusted without revalidating
+LISTBOX_LIMIT: int = 200  # most rows put in the chapter list at once; the search box narrows the rest
+DOWNLOAD_PARTS: int = 4  # parallel Range requests for large update downloads
+DOWNLOAD_SPLIT_MIN: int = 8 * 1024 * 1024  # smaller assets are fetched in one stream
 
 # --- Tkinter Initialization ---
 root = tk.Tk()
-root.title(f"Flashcards© v{VERSION}{f'-p{PLAYTEST}' if PLAYTEST else ''}: {VERSION_NAME}")
+root.title(TITLE_STR)
 root.minsize(WIDTH, HEIGHT)
 root.geometry(f"{WIDTH}x{HEIGHT}")
 
@@ -51,24 +77,27 @@ logging.basicConfig(
 )
 
 # ------ Helper Functions ------
+# PyInstaller's _MEIPASS (or the working directory) can't change while running, so resolve it once
+_RESOURCE_BASE: Path = Path(getattr(sys, "_MEIPASS", None) or os.path.abspath("."))
+
+
+@functools.lru_cache(maxsize=256)
 def resource_path(relative_path: str) -> str:
     """Get absolute path to resource, works for dev and for PyInstaller .exe."""
-    try:
-        base_path: str = sys._MEIPASS  # type: ignore[attr-defined]
-    except Exception:
-        base_path = os.path.abspath(".")
-    return os.path.join(base_path, relative_path)
+    return str(_RESOURCE_BASE / relative_path)
+
+
+SILENCE_PATH: str = resource_path("silence.mp3")
+
 
 def fetch_versions_json() -> dict:
     """Load versions.json."""
     try:
-        resp: requests.Response = requests.get(LATEST_JSON_URL, timeout=15)
-        resp.raise_for_status()
-    except requests.RequestException as e:
+        return conditional_get(LATEST_JSON_URL, VERSIONS_CACHE_PATH, CACHE_MAX_AGE)
+    except (requests.RequestException, json.JSONDecodeError) as e:
         logging.fatal(f"A fatal error occurred while fetching versions.json: {e}")
         messagebox.showerror("Fatal", f"A fatal error occurred:\n{e}")
         sys.exit(1)
-    return resp.json()
 
 
 VERSIONS_JSON: dict = fetch_versions_json()
@@ -77,75 +106,175 @@ LATEST_VERSION: str = VERSIONS_JSON.get("latest", VERSION)
 
 def check_update_available(current: str, latest: str) -> tuple[bool, str]:
     """Return (is_update, latest_version) when latest > current."""
+    if current == latest:  # the usual case; no need to parse either version
+        return False, current
     try:
         current_version = Version(current)
         latest_version = Version(latest)
     except Exception:
         return False, current
 
-    logging.debug(f"Current: {current_version} | Latest: {latest_version}")
-    return (latest_version > current_version, latest if latest_version > current_version else current)
+    logging.debug("Current: %s | Latest: %s", current_version, latest_version)
+    is_newer: bool = latest_version > current_version
+    return is_newer, latest if is_newer else current
 
 
 def get_splashtext() -> list[str]:
     try:
-        response: requests.Response = requests.get(SPLASH_JSON_URL, timeout=15)
-        response.raise_for_status()
-        return typing.cast(list[str], response.json())
-    except requests.RequestException as e:
+        return typing.cast(list[str], conditional_get(SPLASH_JSON_URL, SPLASH_CACHE_PATH, CACHE_MAX_AGE))
+    except (requests.RequestException, json.JSONDecodeError) as e:
         logging.error(f"Error getting splash text: {e}")
         return ["ERROR: Server returned an error."]
 
 
-def setdefault_advanced(collection: dict | list, key, default_value):
-    def _merge(current, default) -> dict | list:
-        if isinstance(default, dict):
-            if not isinstance(current, dict):
-                return default
-            for k, v in default.items():
-                current[k] = _merge(current.get(k), v) if k in current else v
-            return current
-        elif isinstance(default, list):
-            if not isinstance(current, list):
-                return default
-            return current
-        else:
-            return current if isinstance(current, type(default)) else default
+def _load_vakken_cache() -> dict:
+    """Load the cached Vakken structure ({"sha", "etag", "structure"}), or {} if unusable."""
+    try:
+        with open(VAKKEN_CACHE_PATH, "rb") as f:
+            cache = json_loads(f.read())
+    except (OSError, json.JSONDecodeError) as e:
+        logging.debug("No usable %s: %s", VAKKEN_CACHE_PATH, e)
+        return {}
+    return cache if isinstance(cache, dict) and isinstance(cache.get("structure"), dict) else {}
+
 
-    if key not in collection:
-        collection[key] = default_value
-    else:
-        collection[key] = _merge(collection[key], default_value)
-    return collection[key]
+def _load_bundled_structure() -> dict:
+    """Load the Vakken snapshot shipped next to the executable, or {} if none was bundled."""
+    try:
+        with open(resource_path("vakken_structure.json"), "rb") as f:
+            structure = json_loads(f.read())
+    except (OSError, json.JSONDecodeError) as e:
+        logging.debug("No bundled vakken_structure.json: %s", e)
+        return {}
+    return structure if isinstance(structure, dict) else {}
 
 
-def serialize_settings(data: dict | list | tk.Variable) -> dict | list:
-    if isinstance(data, tk.Variable):
-        return data.get()
-    elif isinstance(data, dict):
-        return {k: serialize_settings(v) for k, v in data.items()}
-    elif isinstance(data, list):
-        return [serialize_settings(i) for i in data]
-    else:
-        return typing.cast(dict | list, data)
+def _save_settings(path: str, data: dict | list | tk.Variable, previous: bytes | None = None) -> bool:
+    """Write the settings unless they serialize to `previous`; returns whether the file was written."""
+    payload: bytes = json_dumps(serialize_settings(data), pretty=True)
+    if payload == previous:
+        return False
+    write_atomic(path, payload)
+    return True
+
+
+def _save_vakken_cache(sha: str, etag: str | None, structure: dict) -> None:
+    try:
+        write_atomic(VAKKEN_CACHE_PATH, json_dumps({"sha": sha, "etag": etag, "structure": structure}))
+    except OSError as e:
+        logging.warning(f"Failed to write {VAKKEN_CACHE_PATH}: {e}")
+
+
+def _intern_card(q: typing.Any, a: typing.Any) -> tuple[typing.Any, typing.Any]:
+    """Intern a card's strings so card comparisons short-circuit on identity."""
+    return (sys.intern(q) if isinstance(q, str) else q, sys.intern(a) if isinstance(a, str) else a)
+
+
+def _build_theme_styles(c: dict[str, str]) -> tuple[list, list, list]:
+    """Expand a THEME_COLORS palette into the ttk style and option-database settings apply_theme pushes."""
+    configures: list[tuple[str, dict]] = [
+        (".", {"background": c["bg"], "foreground": c["fg"]}),
+        ("TButton", {"background": c["btn_bg"], "foreground": c["fg"], "relief": tk.SOLID}),
+        ("TLabel", {"background": c["bg"], "foreground": c["fg"]}),
+        (
+            "TCombobox",
+            {"fieldbackground": c["field_bg"], "background": c["field_bg"], "foreground": c["fg"], "relief": tk.FLAT},
+        ),
+        ("TEntry", {"fieldbackground": c["field_bg"], "foreground": c["fg"], "insertcolor": c["fg"]}),
+        ("TCheckbutton", {"background": c["bg"], "foreground": c["fg"]}),
+        ("TFrame", {"background": c["bg"]}),
+        ("Horizontal.TProgressbar", {"background": c["highlight"]}),
+    ]
+    maps: list[tuple[str, dict]] = [
+        ("TButton", {"background": [("active", c["hover_bg"])]}),
+        (
+            "TCombobox",
+            {
+                "fieldbackground": [("readonly", c["field_bg"])],
+                "background": [("active", c["hover_bg"])],
+                "foreground": [("readonly", c["fg"])],
+            },
+        ),
+        ("TCheckbutton", {"background": [("active", c["hover_bg"])]}),
+    ]
+    options: list[tuple[str, str]] = [
+        ("*Listbox.background", c["bg"]),
+        ("*Listbox.foreground", c["fg"]),
+        ("*Listbox.highlightBackground", c["highlight"]),
+        ("*Listbox.selectBackground", c["highlight"]),
+    ]
+    return configures, maps, options
+
+
+class Translations(dict):
+    """Translation table that falls back to the key itself for missing entries."""
+
+    def __missing__(self, key: str) -> str:
+        return key
+
+
+class SecondCachedFormatter(logging.Formatter):
+    """Formatter that runs strftime at most once per second for the default asctime format."""
+
+    _second: int = -1
+    _stamp: str = ""
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:
+        if datefmt is not None:
+            return super().formatTime(record, datefmt)
+        second: int = int(record.created)
+        if second != self._second:
+            self._second, self._stamp = second, time.strftime(self.default_time_format, self.converter(record.created))
+        return self.default_msec_format % (self._stamp, record.msecs)
 
 
 class TkinterLogHandler(logging.Handler):
-    def __init__(self, log_var: tk.StringVar, max_lines: int = 10):
+    def __init__(self, log_var: tk.StringVar, max_lines: int = 10, interval_ms: int = 50):
         super().__init__()
         self.log_var = log_var
         self.max_lines = max_lines
-        self.logs: list[str] = []
+        self.interval_ms = interval_ms
+        self.logs: deque[str] = deque(maxlen=max_lines)
+        self._pending: bool = False
 
     def emit(self, record):
-        log_entry = self.format(record)
-        self.logs.append(log_entry)
-        if len(self.logs) > self.max_lines:
-            self.logs.pop(0)
+        self.logs.append(self.format(record))
+        # Coalesce bursts of records into one StringVar update (and one label redraw)
+        if not self._pending:
+            self._pending = True
+            root.after(self.interval_ms, self._flush)
+
+    def _flush(self) -> None:
+        self._pending = False
         self.log_var.set("\n".join(self.logs))
 
 
 class Menu:
+    THEME_COLORS: dict[str, dict[str, str]] = {
+        "light": {
+            "bg": "#f0f0f0",
+            "fg": "#000000",
+            "field_bg": "#ffffff",
+            "btn_bg": "#e0e0e0",
+            "hover_bg": "#d0d0d0",
+            "highlight": "#0078d7",
+            "border": "#7a7a7a",
+        },
+        "dark": {
+            "bg": "#2e2e2e",
+            "fg": "#ffffff",
+            "field_bg": "#3e3e3e",
+            "btn_bg": "#444444",
+            "hover_bg": "#555555",
+            "highlight": "#666666",
+            "border": "#777777",
+        },
+    }
+    # (style.configure entries, style.map entries, option_add entries) per theme, built once
+    THEME_STYLES: dict[str, tuple[list, list, list]] = {
+        name: _build_theme_styles(colors) for name, colors in THEME_COLORS.items()
+    }
+
     def __init__(self) -> None:
         logging.info("Running...")
 
@@ -153,24 +282,58 @@ class Menu:
         self.log_handler = TkinterLogHandler(self.log_output_var)
         self.log_handler.setLevel(logging.INFO)
         self.log_handler.setFormatter(
-            logging.Formatter("[{asctime}][{levelname}] {message}", style="{")
+            SecondCachedFormatter("[{asctime}][{levelname}] {message}", style="{")
         )
         logging.getLogger().addHandler(self.log_handler)
 
         style.configure("TButton", padding=2, font=("Helvetica", 12))
+        # Named styles let every menu share one font spec instead of passing font tuples per label
+        style.configure("Title.TLabel", font=("Impact", 36))
+        style.configure("Copyright.TLabel", font=("Arial", 10, "italic"))
 
         self.current_music: str | None = None
+        # tr is the bound lookup of the active Translations, rebound whenever the language changes
+        self.tr: typing.Callable[[str], str] = Translations().__getitem__
+        # Every pygame call runs on this one worker, in submission order, starting with setup_music
+        self._music_worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="music")
+        self._mixer_ready: bool = False  # only read and written on the music worker
+        self._last_theme: str | None = None
+        self.temp_flip_override: dict[str, tk.BooleanVar] = {}
+        self._flip_override_key: tuple[str, ...] | None = None  # (jaar, niveau, vak, chapter) the overrides belong to
+        self._meta_paras: list[str] = []
+        self._meta_paras_key: tuple[str, ...] | None = None
+        self.splash: str = ""  # picked once per launch so rebuilding main() keeps the same line
+        self.splash_label: ttk.Label | None = None
+
+        # Menus are built once and re-packed on later visits; per-visit state is applied by their refresher
+        self.view: ttk.Frame | None = None
+        self._menu_frames: dict[typing.Callable[[], None], ttk.Frame] = {}
+        self._persistent_menus: tuple[typing.Callable[[], None], ...] = (
+            self.main, self.settings, self.music_config, self.setup, self.cards, self.finish
+        )
+        self._menu_refreshers: dict[typing.Callable[[], None], typing.Callable[[], None]] = {
+            self.setup: self.refresh_setup,
+            self.cards: self.refresh_cards,
+            self.finish: self.refresh_finish,
+        }
 
         self.change(self.loading)
         root.after(500, threading.Thread(target=self.finish_init, daemon=True).start)
 
     def finish_init(self) -> None:
-        # --- Get Latest Update and Generate Splashtext ---
+        # --- Start network-bound work; it runs while settings and languages load ---
+        pool = ThreadPoolExecutor(max_workers=2)
+        splash_future: Future[list[str]] = pool.submit(get_splashtext)
+        # The callback runs on the pool thread, so hop to the Tk thread before touching widgets
+        splash_future.add_done_callback(lambda future: root.after(0, self.on_splashtext, future))
+        structure_future = pool.submit(self.fetch_structure)
+        pool.shutdown(wait=False)
+
+        # --- Get Latest Update ---
         # Correct order: current=VERSION, latest=LATEST_VERSION
         self.update_available: tuple[bool, str] = check_update_available(
             VERSION, LATEST_VERSION
         )
-        self.splashtext_array = get_splashtext()
 
         # --- Setup Settings ---
         self.settings_var: dict = self.settings_exists()
@@ -209,18 +372,35 @@ class Menu:
             },
         )
 
+        # - shortcuts for variables read on every music change -
+        self.vol_var: tk.IntVar = self.settings_var["music"]["volume"]
+        self.music_title_var: tk.StringVar = self.settings_var["music"]["title"]
+        self.music_cards_var: tk.StringVar = self.settings_var["music"]["cards"]
+
+        # --- Open the audio device in the background; music queued before it is ready waits behind it ---
+        # finish_init is itself a worker thread, so this read (like its other Tk variable reads) is marshalled to
+        # the Tk thread; that is safe because the Tk thread never waits on this thread. Passing the volume in
+        # keeps the music worker free of Tcl calls altogether.
+        self._music_worker.submit(self.setup_music, self.vol_var.get() * 0.01)
+
         # --- Setup GUI & Music ---
         self.load_languages()
         lang_code = self.settings_var["language"].get()
         self.current_language = lang_code
-        self.translations = self.language_data.get(lang_code, {})
+        self.translations = self._ensure_language(lang_code)
+        self.tr = self.translations.__getitem__
 
         self.apply_theme()
         self.rebuild_theme_map()
-        self.setup_music()
 
-        # --- Setup File Structure ---
-        self.fetch_structure()
+        # --- Wait for File Structure ---
+        try:
+            structure_future.result()
+        except Exception as e:
+            # An uncaught error here would kill this thread and leave the loading screen up forever
+            logging.exception(f"Failed to load the Vakken structure: {e}")
+            self.structure = _load_vakken_cache().get("structure") or _load_bundled_structure()
+            self.index_structure()
 
         # --- Auto-update Functionality ---
         if (
@@ -236,7 +416,10 @@ class Menu:
             logging.info("Auto update: this is the latest version.")
 
         logging.info("Done!")
-        self.change(self.main)
+        # Only the loading screen shows these lines, so stop formatting records for it from here on
+        logging.getLogger().removeHandler(self.log_handler)
+        # Widgets must be created on the Tk thread
+        root.after(0, self.change, self.main)
 
     def rebuild_theme_map(self) -> None:
         logging.info("Running...")
@@ -248,14 +431,14 @@ class Menu:
         """Authenticated download via GitHub Releases API."""
         logging.info("Running...")
 
-        logging.debug(f"tag set to: {target_version}")
+        logging.debug("tag set to: %s", target_version)
 
         filename: str = f"flashcards.v{target_version}.exe"
 
         # 1) Fetch release by tag
         rel_url: str = f"https://api.github.com/repos/{OWNER}/{REPO}/releases/tags/{target_version}"
         try:
-            resp: requests.Response = requests.get(rel_url, timeout=30)
+            resp: requests.Response = SESSION.get(rel_url, timeout=30)
             if resp.status_code == 404:
                 messagebox.showerror("Error", f"No release found for tag '{target_version}'.")
                 logging.error(f"No release for tag '{target_version}' → 404")
@@ -265,7 +448,7 @@ class Menu:
             messagebox.showerror("Error", f"Failed to query GitHub releases: {e}")
             logging.error(f"Releases API error: {e}")
             return
-        release = resp.json()
+        release = json_loads(resp.content)
 
         # 2) Find the asset whose name matches
         asset = next((a for a in release.get("assets", []) if a.get("name") == filename), None)
@@ -281,19 +464,49 @@ class Menu:
             f"https://api.github.com/repos/{OWNER}/{REPO}/releases/assets/{asset['id']}"
         )
         try:
-            r2: requests.Response = requests.get(download_url, stream=True, timeout=60)
+            r2: requests.Response = SESSION.get(
+                download_url, headers={"Accept": "application/octet-stream"}, stream=True, timeout=60
+            )
             r2.raise_for_status()
         except requests.RequestException as e:
             messagebox.showerror("Download Failed", str(e))
             logging.error(f"Download error: {e}")
             return
 
-        # 4) Write to disk and notify
+        # 4) Write to a .part file, swapped in only once complete, and notify
         local_path: str = os.path.join(os.getcwd(), filename)
-        with open(local_path, "wb") as f:
-            for chunk in r2.iter_content(8192):
-                if chunk:
-                    f.write(chunk)
+        part_path: str = f"{local_path}.part"
+        size: int = int(r2.headers.get("Content-Length") or 0)
+        ranged: bool = size >= DOWNLOAD_SPLIT_MIN and r2.headers.get("Accept-Ranges") == "bytes"
+        try:
+            with open(part_path, "wb") as f:
+                if size:
+                    f.truncate(size)  # reserve the whole file up front
+                if not ranged:
+                    r2.raw.decode_content = True
+                    shutil.copyfileobj(r2.raw, f, length=1024 * 1024)
+                    f.truncate()
+
+            if ranged:
+                # r2.url is the redirected asset URL; split it over parallel Range requests instead
+                r2.close()
+                step: int = -(-size // DOWNLOAD_PARTS)
+                bounds: list[tuple[int, int]] = [(lo, min(lo + step, size) - 1) for lo in range(0, size, step)]
+                logging.info(f"Downloading {size} bytes in {len(bounds)} parts")
+                with ThreadPoolExecutor(max_workers=DOWNLOAD_PARTS) as pool:
+                    list(pool.map(lambda b: download_range(r2.url, part_path, *b), bounds))
+            os.replace(part_path, local_path)
+        except Exception as e:
+            # A pre-sized file looks complete even when parts are missing, so never leave it behind
+            try:
+                os.remove(part_path)
+            except OSError:
+                pass
+            messagebox.showerror("Download Failed", str(e))
+            logging.error(f"Download error: {e}")
+            return
+        finally:
+            r2.close()
 
         messagebox.showinfo(
             "Update Complete",
@@ -306,23 +519,23 @@ class Menu:
     def load_languages(self) -> None:
         logging.info("Running...")
 
-        self.language_data: dict[str, dict[str, str]] = {}
+        self.language_data: dict[str, Translations] = {}
         self.code_to_display: dict[str, str] = {}
         self.display_to_code: dict[str, str] = {}
         self.available_languages: list[str] = []
 
         lang_dir: str = resource_path("languages")
         if os.path.isdir(lang_dir):
-            for file in os.listdir(lang_dir):
-                if file.endswith(".json"):
-                    lang_code: str = file[:-5]
-                    with open(os.path.join(lang_dir, file), encoding="utf-8") as f:
-                        lang_data = json.load(f)
-                        display_name = lang_data.get("language_name", lang_code)
-                        self.language_data[lang_code] = lang_data
-                        self.code_to_display[lang_code] = display_name
-                        self.display_to_code[display_name] = lang_code
-                        self.available_languages.append(display_name)
+            with os.scandir(lang_dir) as entries:
+                for entry in entries:
+                    if not (entry.name.endswith(".json") and entry.is_file()):
+                        continue
+                    lang_code: str = entry.name[:-5]
+                    # Each file names itself; _ensure_language keeps the parse, so the active one isn't read twice
+                    display_name = self._ensure_language(lang_code).get("language_name", lang_code)
+                    self.code_to_display[lang_code] = display_name
+                    self.display_to_code[display_name] = lang_code
+                    self.available_languages.append(display_name)
 
         if "language" not in self.settings_var:
             default_code = list(self.code_to_display.keys())[0] if self.code_to_display else "en"
@@ -336,55 +549,52 @@ class Menu:
 
         logging.info("Done!")
 
+    def _ensure_language(self, lang_code: str) -> Translations:
+        """Return the translations for `lang_code`, reading its file on first use."""
+        if lang_code not in self.language_data:
+            try:
+                with open(os.path.join(resource_path("languages"), f"{lang_code}.json"), "rb") as f:
+                    self.language_data[lang_code] = Translations(json_loads(f.read()))
+            except (OSError, json.JSONDecodeError) as e:
+                logging.error(f"Failed to load language '{lang_code}': {e}")
+                self.language_data[lang_code] = Translations()
+        return self.language_data[lang_code]
+
     def apply_theme(self) -> None:
         """Apply light or dark theme to all Ttk widgets."""
         logging.info("Running...")
 
-        style.theme_use("clam")
-
-        if self.settings_var["theme"].get() == "dark":
-            self.bg = "#2e2e2e"
-            self.fg = "#ffffff"
-            self.field_bg = "#3e3e3e"
-            self.btn_bg = "#444444"
-            self.hover_bg = "#555555"
-            self.highlight = "#666666"
-            self.border = "#777777"
-        else:
-            self.bg = "#f0f0f0"
-            self.fg = "#000000"
-            self.field_bg = "#ffffff"
-            self.btn_bg = "#e0e0e0"
-            self.hover_bg = "#d0d0d0"
-            self.highlight = "#0078d7"
-            self.border = "#7a7a7a"
-
-        root.configure(bg=self.bg)
-        style.configure(".", background=self.bg, foreground=self.fg)
-        style.configure("TButton", background=self.btn_bg, foreground=self.fg, relief=tk.SOLID)
-        style.map("TButton", background=[("active", self.hover_bg)])
-        style.configure("TLabel", background=self.bg, foreground=self.fg)
-        style.configure(
-            "TCombobox",
-            fieldbackground=self.field_bg,
-            background=self.field_bg,
-            foreground=self.fg,
-            relief=tk.FLAT,
-        )
-        style.map("TCombobox", fieldbackground=[("readonly", self.field_bg)], background=[("active", self.hover_bg)], foreground=[("readonly", self.fg)])
-        style.configure("TCheckbutton", background=self.bg, foreground=self.fg)
-        style.map("TCheckbutton", background=[("active", self.hover_bg)])
-        style.configure("TFrame", background=self.bg)
-        style.configure("Horizontal.TProgressbar", background=self.highlight)
+        theme: str = "dark" if self.settings_var["theme"].get() == "dark" else "light"
+        if theme == self._last_theme:
+            logging.info("Done! (theme unchanged)")
+            return
+        self._last_theme = theme
+
+        # theme_use() restyles every widget, so only do it once
+        if style.theme_use() != "clam":
+            style.theme_use("clam")
+
+        colors: dict[str, str] = self.THEME_COLORS[theme]
+        configures, maps, options = self.THEME_STYLES[theme]
+        root.configure(bg=colors["bg"])
+        for widget, cfg in configures:
+            style.configure(widget, **cfg)
+        for widget, cfg in maps:
+            style.map(widget, **cfg)
+        # tk.Listbox isn't ttk-styled; option-database defaults apply to every listbox created afterwards
+        for pattern, value in options:
+            root.option_add(pattern, value)
 
         logging.info("Done!")
 
     def settings_exists(self) -> dict[str, tk.Variable | dict[str, tk.Variable]]:
         logging.info("Running...")
+        self._settings_bytes: bytes | None = None
         try:
-            with open("settings.json", "r", encoding="utf-8") as f:
-                contents: str = f.read().strip()
-                settings = json.loads(contents) if contents else {}
+            with open("settings.json", "rb") as f:
+                self._settings_bytes = f.read()
+                contents: bytes = self._settings_bytes.strip()
+                settings = json_loads(contents) if contents else {}
         except FileNotFoundError as e:
             logging.warning("file settings.json not found.")
             if messagebox.askyesno(
@@ -394,10 +604,8 @@ class Menu:
                     "Make a new file?"
                 ),
             ):
-                with open("settings.json", "x", encoding="utf-8") as f:
-                    json.dump({}, f, indent=4)
-                with open("settings.json", "r", encoding="utf-8") as f:
-                    settings = json.load(f)
+                _save_settings("settings.json", {})
+                settings = {}
             else:
                 self.on_closing(True)
                 sys.exit(0)
@@ -408,65 +616,76 @@ class Menu:
 
     def convert_settings(self, settings: dict | list) -> dict | list:
         logging.info("Running...")
-        if isinstance(settings, dict):
-            for key, value in list(settings.items()):
-                if isinstance(value, (dict, list)):
-                    settings[key] = self.convert_settings(value)
-                elif isinstance(value, bool):
-                    settings[key] = tk.BooleanVar(root, value)
-                elif isinstance(value, int):
-                    settings[key] = tk.IntVar(root, value)
-                elif isinstance(value, str):
-                    settings[key] = tk.StringVar(root, value)
-        elif isinstance(settings, list):
-            for i, value in enumerate(list(settings)):
-                if isinstance(value, (dict, list)):
-                    settings[i] = self.convert_settings(value)
-                elif isinstance(value, bool):
-                    settings[i] = tk.BooleanVar(root, value)
-                elif isinstance(value, int):
-                    settings[i] = tk.IntVar(root, value)
-                elif isinstance(value, str):
-                    settings[i] = tk.StringVar(root, value)
+        convert_settings(settings, root)
         logging.info("Done!")
         return settings
 
     def fetch_structure(self) -> None:
+        """Load the Vakken structure, re-downloading it only when the repository has changed."""
+        logging.info("Running...")
+
+        cache: dict = _load_vakken_cache()
+        # First run (no cache yet): seed with the snapshot bundled into the build, if there is one
+        seed: dict = cache["structure"] if cache else _load_bundled_structure()
+        headers: dict[str, str] = {"If-None-Match": cache["etag"]} if cache.get("etag") else {}
+        sha: str | None = None
+        etag: str | None = cache.get("etag")
+        try:
+            r: requests.Response = SESSION.get(VAKKEN_COMMIT_URL, headers=headers, timeout=15)
+            if r.status_code == 304:
+                sha = cache.get("sha")
+            else:
+                r.raise_for_status()
+                sha, etag = json_loads(r.content).get("sha"), r.headers.get("ETag")
+        except (requests.RequestException, json.JSONDecodeError) as e:
+            logging.error(f"Failed to check {VAKKEN_REPO} for changes: {e}")
+
+        # An unreachable API (sha is None) also falls back to the cache
+        if cache and (sha is None or sha == cache.get("sha")):
+            logging.info("Vakken unchanged, using cached structure.")
+            self.structure: dict = cache["structure"]
+        else:
+            self.structure = self.download_structure()
+            if sha and self.structure:
+                _save_vakken_cache(sha, etag, self.structure)
+            elif not self.structure:
+                # The seed is the stale cache when there is one, which beats a snapshot only as new as the build
+                logging.warning("Could not download Vakken, keeping the %s structure.", "cached" if cache else "bundled")
+                self.structure = seed
+
+        self.index_structure()
+        logging.info("Done!")
+
+    def index_structure(self) -> None:
+        """Precompute the key tuple of every jaar/niveau/vak level, keyed by its path, for the setup widgets."""
+        keys: dict[tuple[str, ...], tuple[str, ...]] = {(): tuple(self.structure)}
+        for jn, jaar_d in self.structure.items():
+            keys[(jn,)] = tuple(jaar_d)
+            for ln, niv_d in jaar_d.items():
+                keys[(jn, ln)] = tuple(niv_d)
+                for vn, vak_d in niv_d.items():
+                    keys[(jn, ln, vn)] = tuple(vak_d)
+        self._structure_keys = keys
+
+    def download_structure(self) -> dict:
         """Fetch the entire Vakken folder structure from GitHub into a nested dict."""
         logging.info("Running...")
 
-        API_BASE: str = f"https://api.github.com/repos/{OWNER}/{VAKKEN_REPO}/contents/Vakken"
+        # One zip archive of the repository replaces a tree listing plus a request per file
+        try:
+            r: requests.Response = SESSION.get(VAKKEN_ZIP_URL, timeout=60)
+            r.raise_for_status()
+            archive = zipfile.ZipFile(io.BytesIO(r.content))
+        except (requests.RequestException, zipfile.BadZipFile) as e:
+            logging.error(f"Failed to fetch {VAKKEN_ZIP_URL}: {e}")
+            return {}
 
-        def get_contents(path: str = "") -> list:
-            url: str = f"{API_BASE}/{path}" if path else API_BASE
-            try:
-                r: requests.Response = requests.get(url, timeout=30)
-                r.raise_for_status()
-                return r.json() if r.status_code == 200 else []
-            except requests.RequestException as e:
-                logging.error(f"Failed to fetch {url}: {e}")
-                return []
-
-        skip_list: list[tuple[str, str, str, Exception]] = []
-
-        # Load raw structure
-        self.structure: dict = {}
-        for jaar in get_contents():
-            if jaar.get("type") == "dir" and str(jaar.get("name", "")).startswith("Jaar"):
-                jn: str = jaar["name"]
-                self.structure[jn] = {}
-                for lvl in get_contents(jn):
-                    if lvl.get("type") == "dir":
-                        ln: str = lvl["name"]
-                        self.structure[jn][ln] = {}
-                        for js in get_contents(f"{jn}/{ln}"):
-                            if js.get("type") == "file" and str(js.get("name", "")).endswith(".json"):
-                                try:
-                                    contents: dict[str, dict[str, dict[str, str]]] = requests.get(js["download_url"], timeout=30).json()  # type: ignore[assignment]
-                                    vak_name: str = js["name"][:-5]  # removes ".json"
-                                    self.structure[jn][ln][vak_name] = contents
-                                except (json.JSONDecodeError, requests.RequestException) as e:
-                                    skip_list.append((jn, ln, js.get("name", "unknown"), e))
+        try:
+            with archive:
+                structure, skip_list = parse_vakken_zip(archive)
+        except zipfile.BadZipFile as e:  # a corrupt member only shows up once it is read
+            logging.error(f"Failed to read {VAKKEN_ZIP_URL}: {e}")
+            return {}
 
         if skip_list:
             for skip in skip_list:
@@ -474,67 +693,85 @@ class Menu:
                     f"Skipped invalid JSON file '{skip[0]}/{skip[1]}/{skip[2]}':\n\t{skip[3]}"
                 )
 
-        # Filter out paragraphs lacking a proper _meta dict
-        for jaar, jaren in list(self.structure.items()):
-            for niveau, vakken in list(jaren.items()):
-                for vak, chapters in list(vakken.items()):
-                    for chapter, paras in list(chapters.items()):
-                        filtered: dict[str, dict] = {
-                            p: data for p, data in paras.items() if isinstance(data.get("_meta"), dict)
-                        }
-                        self.structure[jaar][niveau][vak][chapter] = filtered
-
         logging.info("Done!")
+        return structure
 
-    def setup_music(self) -> None:
-        """Initialize Pygame's mixer and start playing silence."""
+    def setup_music(self, volume: float) -> None:
+        """Import and initialize Pygame's mixer and start playing silence (runs on the music worker, no Tk calls)."""
+        global pygame, mixer
         logging.info("Running...")
-        mixer.init()
-        mixer.music.load(resource_path("silence.mp3"))
-        mixer.music.set_volume(self.settings_var["music"]["volume"].get() / 100)
-        mixer.music.play(loops=-1)
+        try:
+            import pygame
+            from pygame import mixer
+            mixer.init()
+            mixer.music.load(SILENCE_PATH)
+            mixer.music.set_volume(volume)
+            mixer.music.play(loops=-1)
+            self._mixer_ready = True
+        except Exception as e:
+            logging.error(f"Failed to initialize the mixer: {e}")
         logging.info("Done!")
 
+    def submit_music(self, action: typing.Callable[[], None]) -> None:
+        """Queue a mixer call on the music worker, so pygame is never used from two threads at once."""
+        def run() -> None:
+            if not self._mixer_ready:
+                return  # setup_music failed: there is no audio
+            try:
+                action()
+            except Exception as e:
+                logging.error(f"Music error: {e}")
+
+        self._music_worker.submit(run)
+
+    def load_music_async(self, path: str, play: bool) -> None:
+        """Load (and optionally start) a track on the music worker so disk I/O doesn't stall the UI."""
+        def load() -> None:
+            mixer.music.load(path)
+            if play:
+                mixer.music.play(loops=-1)
+
+        self.submit_music(load)
+
     def switch_music(self, type_: str) -> None:
         """Switch to a specific music track ("title" or "cards")."""
-        logging.info("Running...")
         if self.current_music == type_:
             return
-        mixer.music.stop()
+        logging.info("Running...")
+        # Tk variables are read here on the Tk thread; only the mixer calls go to the music worker
+        music_var: tk.StringVar | None = {"title": self.music_title_var, "cards": self.music_cards_var}.get(type_)
+        music_path: str = music_var.get() if music_var is not None else "silence.mp3"
+        volume: float = self.vol_var.get() * 0.01
+        self.submit_music(functools.partial(self._play_track, music_path, volume))
+        self.current_music = type_
+        logging.info("Done!")
 
-        try:
-            music_path = self.settings_var["music"][type_].get()
-        except Exception:
-            music_path = "silence.mp3"
+    def _play_track(self, music_path: str, volume: float) -> None:
+        """Replace the playing track, falling back to silence; runs on the music worker."""
         full_path: str = resource_path(music_path)
-
+        mixer.music.stop()
         try:
             mixer.music.load(full_path)
-            mixer.music.set_volume(self.settings_var["music"]["volume"].get() / 100)
+            mixer.music.set_volume(volume)
             mixer.music.play(loops=-1)
             logging.info(f"Now playing '{music_path}'")
         except (FileNotFoundError, pygame.error) as e:
             logging.warning(f"Failed to load '{music_path}': {e}")
             try:
-                mixer.music.load(resource_path("silence.mp3"))
-                mixer.music.set_volume(self.settings_var["music"]["volume"].get() / 100)
+                mixer.music.load(SILENCE_PATH)
+                mixer.music.set_volume(volume)
                 mixer.music.play(loops=-1)
                 logging.info("Fallback to silence.mp3")
             except Exception as fallback_error:
                 logging.error(f"Even fallback failed: {fallback_error}")
 
-        self.current_music = type_
-        logging.info("Done!")
-
-    def tr(self, key: str) -> str:
-        """Translate a UI key into the current language."""
-        return self.translations.get(key, key)
-
     def change(self, menu: typing.Callable[[], None]) -> None:
-        """Remove all widgets, adjust music, and call the new menu."""
+        """Hide the current menu, adjust music, and show the new one (building it if needed)."""
         logging.info("Running...")
-        for widget in root.winfo_children():
-            widget.destroy()
+        if self.view is not None:
+            self.view.pack_forget()
+            if self.view not in self._menu_frames.values():
+                self.view.destroy()
 
         if menu != self.loading:
             if menu not in [self.cards, self.finish]:
@@ -545,77 +782,106 @@ class Menu:
                 self.switch_music("cards")
 
         logging.info(f"Done! (switch to: {menu.__name__})")
-        menu()
+        frame: ttk.Frame | None = self._menu_frames.get(menu)
+        if frame is None:
+            frame = self.view = ttk.Frame(root)
+            menu()
+            if menu in self._persistent_menus:
+                self._menu_frames[menu] = frame
+        self.view = frame
+        refresher = self._menu_refreshers.get(menu)
+        if refresher is not None:
+            refresher()
+        frame.pack(fill="both", expand=True)
+
+    def invalidate_menus(self) -> None:
+        """Drop cached menus so they are rebuilt (e.g. with new translations) on their next visit."""
+        for frame in self._menu_frames.values():
+            if frame is not self.view:
+                frame.destroy()
+        self._menu_frames.clear()
+
+    def copyright_label(self) -> None:
+        """Pack the copyright footer at the bottom of the current view."""
+        ttk.Label(
+            self.view,
+            text="Copyright © Raoul van Zomeren. All rights reserved.",
+            style="Copyright.TLabel",
+        ).pack(pady=(10, 0))
 
     # ------ Views ------
     def loading(self) -> None:
-        ttk.Label(root, text="Loading...", font=("Impact", 36)).pack(pady=(20, 0))
-        ttk.Label(root, text="Please Wait", font=("Arial", 12, "italic")).pack()
-        pb = ttk.Progressbar(root, length=600, mode="indeterminate", maximum=100)
+        ttk.Label(self.view, text="Loading...", style="Title.TLabel").pack(pady=(20, 0))
+        ttk.Label(self.view, text="Please Wait", font=("Arial", 12, "italic")).pack()
+        pb = ttk.Progressbar(self.view, length=600, mode="indeterminate", maximum=100)
         pb.pack(pady=(10, 10))
         pb.start(10)
         ttk.Label(
-            root,
+            self.view,
             textvariable=self.log_output_var,
             font=("Courier New", 10),
             anchor="w",
             justify="left",
         ).pack(pady=10)
-        ttk.Label(
-            root,
-            text="Copyright © Raoul van Zomeren. All rights reserved.",
-            font=("Arial", 10, "italic"),
-        ).pack(pady=(10, 0))
+        self.copyright_label()
+
+    def on_splashtext(self, future: Future[list[str]]) -> None:
+        """Pick this launch's splash line once its request finishes and show it on the main menu."""
+        try:
+            splashtext_array: list[str] = future.result()
+        except Exception as e:
+            logging.error(f"Error getting splash text: {e}")
+            splashtext_array = []
+        self.splash = random.choice(splashtext_array) if splashtext_array else ""
+        if self.splash_label is not None and self.splash_label.winfo_exists():
+            self.splash_label.config(text=self.splash)
 
     def main(self) -> None:
         ttk.Label(
-            root,
-            text=f"Flashcards© v{VERSION}{f'-p{PLAYTEST}' if PLAYTEST else ''}",
-            font=("Impact", 36),
+            self.view,
+            text=TITLE_SHORT,
+            style="Title.TLabel",
         ).pack(pady=(20, 0))
 
         if self.update_available[0]:
             subtitle = ttk.Label(
-                root,
+                self.view,
                 text=f"{self.tr('update_available')} ({VERSION} → {self.update_available[1]})",
                 font=("Helvetica", 20, "bold"),
             )
         else:
-            subtitle = ttk.Label(root, text=f"{VERSION_NAME}", font=("Helvetica", 24, "bold"))
+            subtitle = ttk.Label(self.view, text=VERSION_NAME, font=("Helvetica", 24, "bold"))
         subtitle.pack(pady=(0, 5))
 
-        splash = random.choice(self.splashtext_array)
-        ttk.Label(root, text=splash, font=("Arial", 12, "italic")).pack(pady=(0, 25))
+        # Empty until on_splashtext fills it in, so a slow splash request never holds up the menu
+        self.splash_label = ttk.Label(self.view, text=self.splash, font=("Arial", 12, "italic"))
+        self.splash_label.pack(pady=(0, 25))
 
-        ttk.Button(root, text=self.tr("start_game"), command=lambda: self.change(self.setup)).pack()
-        ttk.Button(root, text=self.tr("settings"), command=lambda: self.change(self.settings)).pack()
-        ttk.Button(root, text=self.tr("quit"), command=self.on_closing).pack(pady=(25, 0))
+        ttk.Button(self.view, text=self.tr("start_game"), command=lambda: self.change(self.setup)).pack()
+        ttk.Button(self.view, text=self.tr("settings"), command=lambda: self.change(self.settings)).pack()
+        ttk.Button(self.view, text=self.tr("quit"), command=self.on_closing).pack(pady=(25, 0))
 
-        ttk.Label(
-            root,
-            text="Copyright © Raoul van Zomeren. All rights reserved.",
-            font=("Arial", 10, "italic"),
-        ).pack(pady=(10, 0))
+        self.copyright_label()
 
     def settings(self) -> None:
-        ttk.Label(root, text=self.tr("settings"), font=("Impact", 36)).pack(pady=(20, 25))
+        ttk.Label(self.view, text=self.tr("settings"), style="Title.TLabel").pack(pady=(20, 25))
 
-        ttk.Checkbutton(root, text=self.tr("infinite"), variable=self.settings_var["infinite"]).pack()
-        ttk.Checkbutton(root, text=self.tr("auto_update"), variable=self.settings_var["auto_update"]).pack()
-        ttk.Checkbutton(root, text=self.tr("advanced_setup"), variable=self.settings_var["advanced_setup"]).pack()
+        ttk.Checkbutton(self.view, text=self.tr("infinite"), variable=self.settings_var["infinite"]).pack()
+        ttk.Checkbutton(self.view, text=self.tr("auto_update"), variable=self.settings_var["auto_update"]).pack()
+        ttk.Checkbutton(self.view, text=self.tr("advanced_setup"), variable=self.settings_var["advanced_setup"]).pack()
 
-        ttk.Frame(root).pack(pady=8)
+        ttk.Frame(self.view).pack(pady=8)
 
-        ttk.Button(root, text=self.tr("music_settings"), command=lambda: self.change(self.music_config)).pack()
-        ttk.Button(root, text=self.tr("download_version"), command=self.select_version).pack()
+        ttk.Button(self.view, text=self.tr("music_settings"), command=lambda: self.change(self.music_config)).pack()
+        ttk.Button(self.view, text=self.tr("download_version"), command=self.select_version).pack()
 
-        ttk.Frame(root).pack(pady=8)
+        ttk.Frame(self.view).pack(pady=8)
 
-        setup_frame = ttk.Frame(root)
+        setup_frame = ttk.Frame(self.view)
 
         if self.settings_var["theme"].get() not in ["light", "dark"]:
             self.settings_var["theme"].set("light")
-        ttk.Label(setup_frame, text=f"{self.tr('theme')}").grid(row=0, column=0)
+        ttk.Label(setup_frame, text=self.tr("theme")).grid(row=0, column=0)
 
         theme_values = list(self.theme_map.values())
         current_internal_theme = self.settings_var["theme"].get()
@@ -626,7 +892,7 @@ class Menu:
         self.theme_setting.bind("<<ComboboxSelected>>", self.on_theme)
         self.theme_setting.grid(row=0, column=1)
 
-        ttk.Label(setup_frame, text=f"{self.tr('language')}").grid(row=1, column=0)
+        ttk.Label(setup_frame, text=self.tr("language")).grid(row=1, column=0)
 
         current_code = self.settings_var["language"].get()
         current_display = self.code_to_display.get(current_code, self.available_languages[0] if self.available_languages else current_code)
@@ -640,20 +906,16 @@ class Menu:
 
         setup_frame.pack()
 
-        exit_frame = ttk.Frame(root)
+        exit_frame = ttk.Frame(self.view)
 
         def back():
-            logging.debug(f"Settings saved snapshot: {self.settings_var}")
+            logging.debug("Settings saved snapshot: %s", self.settings_var)
             self.change(self.main)
 
         ttk.Button(exit_frame, text=self.tr("back"), command=back).grid(row=0, column=1)
         exit_frame.pack(pady=(25, 0))
 
-        ttk.Label(
-            root,
-            text="Copyright © Raoul van Zomeren. All rights reserved.",
-            font=("Arial", 10, "italic"),
-        ).pack(pady=(10, 0))
+        self.copyright_label()
 
     def select_version(self) -> None:
         popup = tk.Toplevel(root)
@@ -665,8 +927,7 @@ class Menu:
         versions_list: list[str] = self.get_available_versions()
         logging.info(f"{versions_list}")
         listbox = tk.Listbox(popup, height=15)
-        for v in versions_list:
-            listbox.insert(tk.END, v)
+        listbox.insert(tk.END, *versions_list)
         listbox.pack(pady=(0, 10))
 
         def confirm() -> None:
@@ -684,7 +945,8 @@ class Menu:
         """Return either the 'releases' or 'playtest' list, depending on PLAYTEST flag."""
         logging.info("[get_available_versions] Running...")
         try:
-            data: dict = fetch_versions_json()
+            # versions.json was already fetched (and revalidated) at import time
+            data: dict = VERSIONS_JSON
             key = "playtest" if PLAYTEST else "releases"
             logging.info("[get_available_versions] Done!")
             return data.get("older", {}).get(key, [])
@@ -699,7 +961,9 @@ class Menu:
         selected_code: str = self.display_to_code.get(selected_display, selected_display)
         self.settings_var["language"].set(selected_code)
         self.current_language = selected_code
-        self.translations = self.language_data.get(self.current_language, {})
+        self.translations = self._ensure_language(self.current_language)
+        self.tr = self.translations.__getitem__
+        self.invalidate_menus()
         self.rebuild_theme_map()
         logging.info("Done!")
         self.change(self.settings)
@@ -710,16 +974,38 @@ class Menu:
         selected_internal: str = self.inverse_theme_map.get(selected_display, "light")
         self.settings_var["theme"].set(selected_internal)
         self.apply_theme()
+        # Listbox colours are only read when a listbox is created, so rebuild the cached setup view
+        setup_frame: ttk.Frame | None = self._menu_frames.pop(self.setup, None)
+        if setup_frame is not None:
+            setup_frame.destroy()
         logging.info("Done!")
 
+    def _music_label(self, music_type: typing.Literal["title", "cards"]) -> str:
+        """Label text for a music slot: its translated name plus the chosen file, or 'none' for silence."""
+        path: str = str(self.settings_var["music"][music_type].get())
+        name: str = self.tr("none") if path.endswith("silence.mp3") else os.path.basename(path)
+        return f"{self.tr(f'{music_type}_music')} ({name})"
+
     def music_config(self) -> None:
         logging.info("Running...")
 
+        vol_after_id: str | None = None
+
+        def apply_volume() -> None:
+            nonlocal vol_after_id
+            vol_after_id = None
+            volume: int = int(float(self.volume_scale.get()))
+            if volume == self.vol_var.get():
+                return
+            self.vol_var.set(volume)
+            self.volume_setting_label.config(text=f"{volume}/100")
+            self.submit_music(lambda: mixer.music.set_volume(volume * 0.01))
+
         def on_volume(_e=None) -> None:
-            vol: float = float(self.volume_scale.get()) / 100
-            self.settings_var["music"]["volume"].set(int(vol * 100))
-            self.volume_setting_label.config(text=f"{int(vol * 100)}/100")
-            mixer.music.set_volume(vol)
+            # A drag fires once per pixel; apply at most one update per 50 ms, using the latest position
+            nonlocal vol_after_id
+            if vol_after_id is None:
+                vol_after_id = root.after(50, apply_volume)
 
         def on_music_select(music_type: typing.Literal["title", "cards"]) -> None:
             filetypes: list[tuple[str, str]] = [(self.tr("music_select_dialogue.files"), "*.mp3 *.wav *.ogg")]
@@ -727,28 +1013,26 @@ class Menu:
             if not path:
                 return
             self.settings_var["music"][music_type].set(path)
-            short = os.path.basename(path)
             if music_type == "title":
-                self.title_music_label.config(text=f"{self.tr('title_music')} ({short})")
-                try:
-                    mixer.music.load(path)
-                    mixer.music.play(loops=-1)
-                except Exception as e:
-                    logging.error(f"Error loading title music: {e}")
+                self.title_music_label.config(text=self._music_label("title"))
+                self.load_music_async(path, play=True)
             else:
-                self.cards_music_label.config(text=f"{self.tr('cards_music')} ({short})")
+                self.cards_music_label.config(text=self._music_label("cards"))
 
         def on_music_reset(music_type: typing.Literal["title", "cards"]) -> None:
-            self.settings_var["music"][music_type].set(resource_path("silence.mp3"))
+            self.settings_var["music"][music_type].set(SILENCE_PATH)
             if music_type == "title":
-                mixer.music.load(self.settings_var["music"][music_type].get())
-            self.change(self.music_config)
+                # Silence needs no decoding: stop the old track, switch_music loads silence.mp3 when it next runs
+                self.submit_music(lambda: mixer.music.stop())
+                self.title_music_label.config(text=self._music_label("title"))
+            else:
+                self.cards_music_label.config(text=self._music_label("cards"))
 
-        ttk.Label(root, text=self.tr("music_settings"), font=("Impact", 36)).pack(pady=(20, 25))
+        ttk.Label(self.view, text=self.tr("music_settings"), style="Title.TLabel").pack(pady=(20, 25))
 
-        vol_frame = ttk.Frame(root)
-        ttk.Label(vol_frame, text=f"{self.tr('volume')}").grid(row=0, column=0)
-        initial: int = int(self.settings_var["music"]["volume"].get())
+        vol_frame = ttk.Frame(self.view)
+        ttk.Label(vol_frame, text=self.tr("volume")).grid(row=0, column=0)
+        initial: int = int(self.vol_var.get())
         self.volume_scale = ttk.Scale(vol_frame, from_=0, to=100, length=500, command=on_volume)
         self.volume_scale.set(initial)
         self.volume_scale.grid(row=0, column=1)
@@ -756,224 +1040,235 @@ class Menu:
         self.volume_setting_label.grid(row=0, column=2)
         vol_frame.pack(pady=(0, 10))
 
-        select_frame = ttk.Frame(root)
-        title_fname = (
-            os.path.basename(self.settings_var["music"]["title"].get())
-            if not str(self.settings_var["music"]["title"].get()).endswith("silence.mp3")
-            else self.tr("none")
-        )
-        self.title_music_label = ttk.Label(
-            select_frame, text=f"{self.tr('title_music')} ({title_fname})"
-        )
+        select_frame = ttk.Frame(self.view)
+        self.title_music_label = ttk.Label(select_frame, text=self._music_label("title"))
         self.title_music_label.grid(row=0, column=0, sticky="w")
         ttk.Button(select_frame, text=self.tr("select_file"), command=lambda: on_music_select("title")).grid(row=0, column=1)
         ttk.Button(select_frame, text=self.tr("reset_file"), command=lambda: on_music_reset("title")).grid(row=0, column=2)
 
-        cards_fname = (
-            os.path.basename(self.settings_var["music"]["cards"].get())
-            if not str(self.settings_var["music"]["cards"].get()).endswith("silence.mp3")
-            else self.tr("none")
-        )
-        self.cards_music_label = ttk.Label(
-            select_frame, text=f"{self.tr('cards_music')} ({cards_fname})"
-        )
+        self.cards_music_label = ttk.Label(select_frame, text=self._music_label("cards"))
         self.cards_music_label.grid(row=1, column=0, sticky="w")
         ttk.Button(select_frame, text=self.tr("select_file"), command=lambda: on_music_select("cards")).grid(row=1, column=1)
         ttk.Button(select_frame, text=self.tr("reset_file"), command=lambda: on_music_reset("cards")).grid(row=1, column=2)
 
         select_frame.pack(pady=(0, 0))
 
-        ttk.Button(root, text=self.tr("back"), command=lambda: self.change(self.settings)).pack(pady=(25, 0))
+        ttk.Button(self.view, text=self.tr("back"), command=lambda: self.change(self.settings)).pack(pady=(25, 0))
         logging.info("Done!")
 
     def setup(self) -> None:
-        ttk.Label(root, text=self.tr("setup"), font=("Impact", 36)).pack(pady=(20, 25))
-        self.resync_setup_values(True)
+        ttk.Label(self.view, text=self.tr("setup"), style="Title.TLabel").pack(pady=(20, 25))
 
-        select_frame = ttk.Frame(root)
-        ttk.Label(select_frame, text=f"{self.tr('grade')}").grid(row=0, column=0)
-        self.jaar_select = ttk.Combobox(
-            select_frame, values=self.jaar_values, state="readonly" if self.jaar_values else "disabled"
-        )
-        self.jaar_select.set(self.last_jaar)
+        # Values, states and selections are filled in by refresh_setup on every visit
+        select_frame = ttk.Frame(self.view)
+        ttk.Label(select_frame, text=self.tr("grade")).grid(row=0, column=0)
+        self.jaar_select = ttk.Combobox(select_frame)
         self.jaar_select.bind("<<ComboboxSelected>>", self.on_jaar_select)
         self.jaar_select.grid(row=0, column=1)
 
-        ttk.Label(select_frame, text=f"{self.tr('educational-level')}").grid(row=1, column=0)
-        self.niveau_select = ttk.Combobox(
-            select_frame, values=self.niveau_values, state="readonly" if self.niveau_values else "disabled"
-        )
-        self.niveau_select.set(self.last_niveau)
+        ttk.Label(select_frame, text=self.tr("educational-level")).grid(row=1, column=0)
+        self.niveau_select = ttk.Combobox(select_frame)
         self.niveau_select.bind("<<ComboboxSelected>>", self.on_niveau_select)
         self.niveau_select.grid(row=1, column=1)
 
-        ttk.Label(select_frame, text=f"{self.tr('subject')}").grid(row=2, column=0)
-        self.vak_select = ttk.Combobox(
-            select_frame, values=self.vak_values, state="readonly" if self.vak_values else "disabled"
-        )
-        self.vak_select.set(self.last_vak)
+        ttk.Label(select_frame, text=self.tr("subject")).grid(row=2, column=0)
+        self.vak_select = ttk.Combobox(select_frame)
         self.vak_select.bind("<<ComboboxSelected>>", self.on_vak_select)
         self.vak_select.grid(row=2, column=1)
 
         ttk.Frame(select_frame).grid(row=3, column=0, columnspan=2, pady=8)
 
         ttk.Label(select_frame, text=self.tr("chapter")).grid(row=4, column=0)
-        self.chapter_select = tk.Listbox(
-            select_frame,
-            state="normal" if self.chapter_values else "disabled",
-            selectmode="single",
-            exportselection=False,
-            bg=self.bg,
-            fg=self.fg,
-            highlightbackground=self.highlight,
-            selectbackground=self.highlight,
-        )
-        if self.chapter_values:
-            for value in self.chapter_values:
-                self.chapter_select.insert(tk.END, value)
+        self.chapter_select = tk.Listbox(select_frame, selectmode="single", exportselection=False)
         self.chapter_select.bind("<<ListboxSelect>>", self.on_chapter_select)
         self.chapter_select.grid(row=5, column=0)
+        ttk.Label(select_frame, text=self.tr("chapter_search")).grid(row=6, column=0)
+        self.chapter_search = ttk.Entry(select_frame)
+        self.chapter_search.bind("<KeyRelease>", self.on_chapter_search)
+        self.chapter_search.grid(row=7, column=0, sticky="ew")
 
         ttk.Label(select_frame, text=self.tr("paragraph")).grid(row=4, column=1)
-        self.paragraph_select = tk.Listbox(
-            select_frame,
-            state="disabled",
-            selectmode="multiple",
-            exportselection=False,
-            bg=self.bg,
-            fg=self.fg,
-            highlightbackground=self.highlight,
-            selectbackground=self.highlight,
-        )
+        self.paragraph_select = tk.Listbox(select_frame, selectmode="multiple", exportselection=False)
         self.paragraph_select.bind("<<ListboxSelect>>", self.on_paragraph_select)
         self.paragraph_select.grid(row=5, column=1)
 
         select_frame.pack(pady=(15, 0))
 
-        navigation_frame = ttk.Frame(root)
+        navigation_frame = ttk.Frame(self.view)
         ttk.Button(navigation_frame, text=self.tr("back"), command=lambda: self.change(self.main)).grid(row=0, column=0)
-        self.continue_button = ttk.Button(
-            navigation_frame, text=self.tr("continue"), state="disabled", command=self.on_continue_setup
-        )
+        self.continue_button = ttk.Button(navigation_frame, text=self.tr("continue"), command=self.on_continue_setup)
         self.continue_button.grid(row=0, column=1)
         navigation_frame.pack(pady=(25, 0))
 
-        ttk.Label(
-            root,
-            text="Copyright © Raoul van Zomeren. All rights reserved.",
-            font=("Arial", 10, "italic"),
-        ).pack(pady=(10, 0))
+        self.copyright_label()
+
+    def refresh_setup(self) -> None:
+        """Reload the last session's selection into the cached setup view."""
+        self.resync_setup_values(True)
+        for combobox, values, current in (
+            (self.jaar_select, self.jaar_values, self.last_jaar),
+            (self.niveau_select, self.niveau_values, self.last_niveau),
+            (self.vak_select, self.vak_values, self.last_vak),
+        ):
+            combobox.config(values=values, state="readonly" if values else "disabled")
+            combobox.set(current)
+        # A disabled Listbox ignores delete/insert, so enable both before refilling them
+        self.chapter_select.config(state="normal")
+        self.chapter_search.delete(0, tk.END)
+        self.fill_chapters()
+        if not self.chapter_values:
+            self.chapter_select.config(state="disabled")
+        self.paragraph_select.config(state="normal")
+        self.paragraph_select.delete(0, tk.END)
+        self.paragraph_select.config(state="disabled")
+        self.continue_button.config(state="disabled")
 
     def resync_setup_values(self, initial: bool = False) -> None:
         logging.info("Running...")
         if initial:
-            self.last_jaar: str = self.settings_var["last_session"]["jaar"].get()
-            self.last_niveau: str = self.settings_var["last_session"]["niveau"].get()
-            self.last_vak: str = self.settings_var["last_session"]["vak"].get()
-
-        self.jaar_values = list(self.structure.keys())
-        self.niveau_values: list[str] = []
-        self.vak_values: list[str] = []
-        self.chapter_values: list[str] = []
-        if self.last_jaar in self.structure:
-            self.niveau_values = list(self.structure[self.last_jaar].keys())
-            self.settings_var["last_session"]["jaar"].set(self.last_jaar)
-            if self.last_niveau in self.structure[self.last_jaar]:
-                self.vak_values = list(self.structure[self.last_jaar][self.last_niveau].keys())
-                self.settings_var["last_session"]["niveau"].set(self.last_niveau)
-                if self.last_vak in self.structure[self.last_jaar][self.last_niveau]:
-                    self.chapter_values = list(
-                        self.structure[self.last_jaar][self.last_niveau][self.last_vak].keys()
-                    )
-                    self.settings_var["last_session"]["vak"].set(self.last_vak)
-                elif self.last_vak != "Selecteer schoolvak":
-                    self.last_vak = "Selecteer schoolvak"
-                    self.settings_var["last_session"]["vak"].set(self.last_vak)
-                    logging.debug(
-                        f"'{self.last_vak}' not in '{list(self.structure[self.last_jaar][self.last_niveau].keys())}'"
-                    )
-            elif self.last_niveau != "Selecteer onderwijsniveau":
-                self.last_niveau = "Selecteer onderwijsniveau"
-                self.settings_var["last_session"]["niveau"].set(self.last_niveau)
-                self.last_vak = "Selecteer leerjaar"
-                self.settings_var["last_session"]["vak"].set(self.last_vak)
-                logging.debug(
-                    f"'{self.last_niveau}' not in '{list(self.structure[self.last_jaar].keys())}'"
-                )
-        elif self.last_jaar != "Selecteer leerjaar":
+            session: dict[str, tk.StringVar] = self.settings_var["last_session"]
+            self._session_saved: dict[str, str] = {level: session[level].get() for level in ("jaar", "niveau", "vak")}
+            self.last_jaar: str = self._session_saved["jaar"]
+            self.last_niveau: str = self._session_saved["niveau"]
+            self.last_vak: str = self._session_saved["vak"]
+        self._resync_jaar()
+        logging.info("Done!")
+
+    def _save_session(self, level: str, value: str) -> None:
+        """Store a last_session selection, skipping the Tk write when it already holds `value`."""
+        if self._session_saved.get(level) != value:
+            self.settings_var["last_session"][level].set(value)
+            self._session_saved[level] = value
+
+    def _resync_jaar(self) -> None:
+        """Validate the selected jaar and everything below it."""
+        self.jaar_values: tuple[str, ...] = self._structure_keys[()]
+        if (self.last_jaar,) in self._structure_keys:
+            self._save_session("jaar", self.last_jaar)
+            self._resync_niveau()
+            return
+        self.niveau_values: tuple[str, ...] = ()
+        self.vak_values: tuple[str, ...] = ()
+        self.chapter_values: tuple[str, ...] = ()
+        if self.last_jaar != "Selecteer leerjaar":
             self.last_jaar = "Selecteer leerjaar"
-            self.settings_var["last_session"]["jaar"].set(self.last_jaar)
+            self._save_session("jaar", self.last_jaar)
             self.last_niveau = "Selecteer onderwijsniveau"
-            self.settings_var["last_session"]["niveau"].set(self.last_niveau)
+            self._save_session("niveau", self.last_niveau)
             self.last_vak = "Selecteer schoolvak"
-            self.settings_var["last_session"]["vak"].set(self.last_vak)
-            logging.debug(f"'{self.last_jaar}' not in '{list(self.structure.keys())}'")
-        logging.info("Done!")
+            self._save_session("vak", self.last_vak)
+            logging.debug("'%s' not in '%s'", self.last_jaar, self.jaar_values)
+
+    def _resync_niveau(self) -> None:
+        """Validate the selected niveau within the selected jaar and everything below it."""
+        self.niveau_values = self._structure_keys[(self.last_jaar,)]
+        if (self.last_jaar, self.last_niveau) in self._structure_keys:
+            self._save_session("niveau", self.last_niveau)
+            self._resync_vak()
+            return
+        self.vak_values = ()
+        self.chapter_values = ()
+        if self.last_niveau != "Selecteer onderwijsniveau":
+            self.last_niveau = "Selecteer onderwijsniveau"
+            self._save_session("niveau", self.last_niveau)
+            self.last_vak = "Selecteer leerjaar"
+            self._save_session("vak", self.last_vak)
+            logging.debug("'%s' not in '%s'", self.last_niveau, self.niveau_values)
+
+    def _resync_vak(self) -> None:
+        """Validate the selected vak within the selected jaar and niveau."""
+        self.vak_values = self._structure_keys[(self.last_jaar, self.last_niveau)]
+        chapters: tuple[str, ...] | None = self._structure_keys.get((self.last_jaar, self.last_niveau, self.last_vak))
+        if chapters is not None:
+            self.chapter_values = chapters
+            self._save_session("vak", self.last_vak)
+            return
+        self.chapter_values = ()
+        if self.last_vak != "Selecteer schoolvak":
+            self.last_vak = "Selecteer schoolvak"
+            self._save_session("vak", self.last_vak)
+            logging.debug("'%s' not in '%s'", self.last_vak, self.vak_values)
 
     def on_jaar_select(self, _event: tk.Event) -> None:
-        logging.info("Running...")
         self.last_jaar = self.jaar_select.get()
         self.niveau_select.config(state="readonly")
         self.niveau_select.set("Selecteer onderwijsniveau")
-        self.niveau_select["values"] = list(self.structure[self.last_jaar].keys())
-        self.vak_select["values"] = []
+        self._save_session("jaar", self.last_jaar)
+        self._resync_niveau()
+        self.niveau_select["values"] = self.niveau_values
+        self.vak_select["values"] = ()
         self.vak_select.set("Selecteer schoolvak")
         self.vak_select.config(state="disabled")
         self.chapter_select.delete(0, tk.END)
         self.chapter_select.config(state="disabled")
         self.paragraph_select.delete(0, tk.END)
         self.paragraph_select.config(state="disabled")
-        logging.debug(f"jaar_select.get() = {self.jaar_select.get()}")
-        self.resync_setup_values()
-        logging.info("Done!")
+        logging.debug("jaar_select.get() = %s", self.last_jaar)
 
     def on_niveau_select(self, _event: tk.Event) -> None:
-        logging.info("Running...")
         self.last_niveau = self.niveau_select.get()
         self.vak_select.config(state="readonly")
         self.vak_select.set("Selecteer schoolvak")
-        self.vak_select["values"] = list(self.structure[self.last_jaar][self.last_niveau].keys())
+        self._save_session("niveau", self.last_niveau)
+        self._resync_vak()
+        self.vak_select["values"] = self.vak_values
         self.chapter_select.delete(0, tk.END)
         self.chapter_select.config(state="disabled")
         self.paragraph_select.delete(0, tk.END)
         self.paragraph_select.config(state="disabled")
-        self.resync_setup_values()
-        logging.info("Done!")
+
+    def fill_chapters(self, query: str = "") -> None:
+        """Show at most LISTBOX_LIMIT chapters, keeping only those containing `query`."""
+        needle: str = query.casefold()
+        matches: typing.Iterable[str] = (
+            (c for c in self.chapter_values if needle in c.casefold()) if needle else self.chapter_values
+        )
+        self.chapter_shown: tuple[str, ...] = tuple(itertools.islice(matches, LISTBOX_LIMIT))
+        self.chapter_select.delete(0, tk.END)
+        if self.chapter_shown:
+            self.chapter_select.insert(tk.END, *self.chapter_shown)
+
+    def on_chapter_search(self, _event: tk.Event) -> None:
+        if str(self.chapter_select.cget("state")) == "disabled":
+            return
+        self.fill_chapters(self.chapter_search.get())
 
     def on_vak_select(self, _event: tk.Event) -> None:
-        logging.info("Running...")
         self.last_vak = self.vak_select.get()
         self.chapter_select.config(state="normal")
-        self.chapter_select.delete(0, tk.END)
-        for value in list(self.structure[self.last_jaar][self.last_niveau][self.last_vak].keys()):
-            self.chapter_select.insert(tk.END, value)
+        self.chapter_values = self._structure_keys[(self.last_jaar, self.last_niveau, self.last_vak)]
+        self.chapter_search.delete(0, tk.END)
+        self.fill_chapters()
         self.paragraph_select.delete(0, tk.END)
         self.paragraph_select.config(state="disabled")
-        self.resync_setup_values()
-        logging.info("Done!")
+        self._save_session("vak", self.last_vak)
 
     def on_chapter_select(self, event: tk.Event) -> None:
-        logging.info("Running...")
         sel = event.widget.curselection() # type: ignore
         if not sel:
             return
-        self.selected_chapter = self.chapter_select.get(sel[0])
+        # The listbox mirrors chapter_shown, so index it in Python instead of asking Tcl
+        self.selected_chapter = self.chapter_shown[sel[0]]
+        chapter_key: tuple[str, ...] = (self.last_jaar, self.last_niveau, self.last_vak, self.selected_chapter)
+        if chapter_key != self._flip_override_key:
+            # Overrides are keyed by paragraph name, so they only carry over while the same chapter is picked
+            self.temp_flip_override = {}
+            self._flip_override_key = chapter_key
         self.paragraph_select.config(state="normal")
         self.paragraph_select.delete(0, tk.END)
         self.selected_paragraphs: list[str] = []
-        for value in list(
-            self.structure[self.last_jaar][self.last_niveau][self.last_vak][self.selected_chapter].keys()
-        ):
-            self.paragraph_select.insert(tk.END, value)
-        self.resync_setup_values()
-        logging.info("Done!")
+        chapter_d = self.structure[self.last_jaar][self.last_niveau][self.last_vak][self.selected_chapter]
+        # Split every paragraph into its _meta and question pairs once; advanced_setup and build_deck reuse it
+        self._chapter_cache: dict[str, dict[str, typing.Any]] = {
+            para: {"meta": data.get("_meta"), "qa": [_intern_card(q, a) for q, a in data.items() if q != "_meta"]}
+            for para, data in chapter_d.items()
+        }
+        self.paragraph_values: tuple[str, ...] = tuple(self._chapter_cache)
+        self.paragraph_select.insert(tk.END, *self.paragraph_values)
 
     def on_paragraph_select(self, _event: tk.Event) -> None:
-        logging.info("Running...")
-        self.selected_paragraphs = [self.paragraph_select.get(i) for i in self.paragraph_select.curselection()]
+        self.selected_paragraphs = [self.paragraph_values[i] for i in self.paragraph_select.curselection()]
         self.continue_button.config(state="normal" if self.selected_paragraphs else "disabled")
-        self.resync_setup_values()
-        logging.info("Done!")
 
     def on_continue_setup(self):
         if self.settings_var["advanced_setup"].get():
@@ -983,50 +1278,53 @@ class Menu:
 
     # ------ Advanced Setup Menu ------
     def advanced_setup(self) -> None:
-        ttk.Label(root, text=self.tr("advanced_setup"), font=("Impact", 36)).pack(pady=(20, 10))
-        main = ttk.Frame(root)
+        ttk.Label(self.view, text=self.tr("advanced_setup"), style="Title.TLabel").pack(pady=(20, 10))
+        main = ttk.Frame(self.view)
         main.pack(fill="both", expand=True, padx=50, pady=10)
         main.columnconfigure(0, weight=1)
         main.columnconfigure(1, weight=1)
 
-        meta_paras = [
-            p
-            for p in self.selected_paragraphs
-            if isinstance(
-                self.structure[self.last_jaar][self.last_niveau][self.last_vak][self.selected_chapter][p].get("_meta"),
-                dict,
-            )
-        ]
+        meta_key: tuple[str, ...] = (
+            self.last_jaar, self.last_niveau, self.last_vak, self.selected_chapter, *self.selected_paragraphs
+        )
+        if self._meta_paras_key != meta_key:
+            self._meta_paras = [p for p in self.selected_paragraphs if isinstance(self._chapter_cache[p]["meta"], dict)]
+            self._meta_paras_key = meta_key
+        meta_paras: list[str] = self._meta_paras
         self.meta_list = tk.Listbox(main, exportselection=False, height=10)
-        for p in meta_paras:
-            self.meta_list.insert(tk.END, p)
+        self.meta_list.insert(tk.END, *meta_paras)
         self.meta_list.grid(row=0, column=0, sticky="nsew", padx=(0, 20))
 
         edit_frame = ttk.Frame(main)
         edit_frame.grid(row=0, column=1, sticky="nsew")
 
-        self.temp_flip_override: dict[str, tk.BooleanVar] = {}
+        # Vars survive repeat visits; on_chapter_select drops them when a different chapter is picked
         for p in meta_paras:
-            dd = (
-                self.structure[self.last_jaar][self.last_niveau][self.last_vak][self.selected_chapter][p]
-            )
-            self.temp_flip_override[p] = tk.BooleanVar(
-                root, bool(dd["_meta"].get("flip", False))
-            )
+            if p not in self.temp_flip_override:
+                self.temp_flip_override[p] = tk.BooleanVar(
+                    root, bool(self._chapter_cache[p]["meta"].get("flip", False))
+                )
+
+        # One label/checkbutton pair is retargeted on every selection instead of being rebuilt
+        meta_label = ttk.Label(edit_frame, font=("Helvetica", 14, "bold"))
+        meta_check = ttk.Checkbutton(edit_frame, text=self.tr("both_ways"))
 
         def on_meta_select(_evt=None):
-            for child in edit_frame.winfo_children():
-                child.destroy()
             sel = self.meta_list.curselection()
             if not sel:
+                meta_label.pack_forget()
+                meta_check.pack_forget()
                 return
-            name = self.meta_list.get(sel[0])
-            ttk.Label(edit_frame, text=name, font=("Helvetica", 14, "bold")).pack(anchor="center", pady=(0, 5))
-            ttk.Checkbutton(edit_frame, text=self.tr("both_ways"), variable=self.temp_flip_override[name]).pack()
+            name = meta_paras[sel[0]]
+            meta_label.config(text=name)
+            meta_check.config(variable=self.temp_flip_override[name])
+            if not meta_label.winfo_manager():
+                meta_label.pack(anchor="center", pady=(0, 5))
+                meta_check.pack()
 
         self.meta_list.bind("<<ListboxSelect>>", on_meta_select)
 
-        btn_frame = ttk.Frame(root)
+        btn_frame = ttk.Frame(self.view)
         btn_frame.pack(pady=(10, 20))
         ttk.Button(btn_frame, text=self.tr("back"), command=lambda: self.change(self.setup)).grid(row=0, column=0, padx=10)
         ttk.Button(btn_frame, text=self.tr("continue"), command=self.cards_setup).grid(row=0, column=1, padx=10)
@@ -1048,53 +1346,54 @@ class Menu:
 
     def build_deck(self) -> None:
         logging.info("Running...")
-        paragraphs = self.structure[self.last_jaar][self.last_niveau][self.last_vak][self.selected_chapter]
-        deck_one: list[tuple[str, str]] = []
-        deck_two: list[tuple[str, str]] = []
-
-        for key, data in paragraphs.items():
-            if key not in self.selected_paragraphs:
-                continue
-
-            flip_var = getattr(self, "temp_flip_override", {}).get(key)
-            if flip_var is not None:
-                flip = bool(flip_var.get())
-            else:
-                flip = bool(data.get("_meta", {}).get("flip", True))
-
-            for q, a in data.items():
-                if q == "_meta":
-                    continue
-                deck_one.append((q, a))
-                deck_two.append((a, q) if flip else (q, a))
+        selected: frozenset[str] = frozenset(self.selected_paragraphs)
+        chosen: list[tuple[list[tuple[str, str]], bool]] = [
+            (entry["qa"], self._flip_for(key, entry, self.temp_flip_override))
+            for key, entry in self._chapter_cache.items()
+            if key in selected
+        ]
 
+        deck_one: list[tuple[str, str]] = [qa for qas, _flip in chosen for qa in qas]
+        deck_two: list[tuple[str, str]] = [
+            (a, q) if flip else (q, a) for qas, flip in chosen for q, a in qas
+        ]
         random.shuffle(deck_one)
         random.shuffle(deck_two)
 
-        self.deck: list[tuple[str, str]] = deck_one + deck_two
+        # Both halves stay separately shuffled (all fronts first); extend() avoids a concatenated copy
+        self.deck: deque[tuple[str, str]] = deque(deck_one)
+        self.deck.extend(deck_two)
         self.total_cards = len(self.deck)
         self.log_correct: list[tuple[str, str]] = []
-        self.log: list[tuple[str, str]] = []
+        self.log: set[tuple[str, str]] = set()
+        # The settings menu is unreachable mid-round, so read the option once per deck
+        self.infinite: bool = bool(self.settings_var["infinite"].get())
         self.side = 0
         self.flipped = False
         logging.info("Done!")
 
+    @staticmethod
+    def _flip_for(key: str, entry: dict[str, typing.Any], overrides: dict[str, tk.BooleanVar]) -> bool:
+        """Whether a paragraph's cards are asked both ways, honouring the advanced setup override."""
+        flip_var = overrides.get(key)
+        if flip_var is not None:
+            return bool(flip_var.get())
+        return bool((entry["meta"] or {}).get("flip", True))
+
     def cards(self) -> None:
-        ttk.Label(root, text=self.tr("flashcards"), font=("Impact", 36)).pack(pady=(20, 25))
-        self.progress_bar = ttk.Progressbar(root, length=WIDTH - 200, mode="determinate", maximum=len(self.deck))
+        ttk.Label(self.view, text=self.tr("flashcards"), style="Title.TLabel").pack(pady=(20, 25))
+        self.progress_bar = ttk.Progressbar(self.view, length=WIDTH - 200, mode="determinate")
         self.progress_bar.pack()
 
-        card_label_frame = ttk.Frame(root, height=200)
-        self.card_label = ttk.Label(
-            card_label_frame, text=self.deck[0][0], font=("Arial", 20), wraplength=WIDTH - 100
-        )
+        card_label_frame = ttk.Frame(self.view, height=200)
+        self.card_label = ttk.Label(card_label_frame, font=("Arial", 20), wraplength=WIDTH - 100)
         self.card_label.pack(anchor="n", padx=(20, 20), pady=(20, 20))
         card_label_frame.pack()
 
-        self.flip_button = ttk.Button(root, text=self.tr("flip"), command=self.on_flip)
+        self.flip_button = ttk.Button(self.view, text=self.tr("flip"), command=self.on_flip)
         self.flip_button.pack()
 
-        judgement_frame = ttk.Frame(root)
+        judgement_frame = ttk.Frame(self.view)
         self.correct_button = ttk.Button(judgement_frame, text=self.tr("correct"), command=self.on_correct)
         self.wrong_button = ttk.Button(judgement_frame, text=self.tr("incorrect"), command=self.on_wrong)
         if DEV_MODE:
@@ -1102,66 +1401,67 @@ class Menu:
             self.wrong_button.grid(row=0, column=1)
         judgement_frame.pack()
 
-        ttk.Button(root, text=self.tr("exit"), command=self.on_cards_exit).pack(pady=(25, 0))
-        ttk.Label(
-            root,
-            text="Copyright © Raoul van Zomeren. All rights reserved.",
-            font=("Arial", 10, "italic"),
-        ).pack(pady=(10, 0))
+        ttk.Button(self.view, text=self.tr("exit"), command=self.on_cards_exit).pack(pady=(25, 0))
+        self.copyright_label()
+
+    def refresh_cards(self) -> None:
+        """Reset the cached cards view for the freshly built deck."""
+        self.progress: int = 0
+        self.progress_bar.config(maximum=len(self.deck), value=0)
+        self.card_label.config(text=self.deck[0][0])
+        # DEV_MODE keeps the judgement buttons on screen the whole time
+        self._judge_visible: bool = True
+        self._show_judgement(DEV_MODE)
+
+    def _show_judgement(self, visible: bool) -> None:
+        """Show or hide the correct/incorrect buttons, skipping the Tk calls when nothing changes."""
+        if DEV_MODE or visible == self._judge_visible:
+            return
+        if visible:
+            self.correct_button.grid(row=0, column=0)
+            self.wrong_button.grid(row=0, column=1)
+        else:
+            self.correct_button.grid_remove()
+            self.wrong_button.grid_remove()
+        self._judge_visible = visible
+
+    def _next_card(self, advanced: bool) -> None:
+        """Show the front of the next card (bumping the progress bar if a card was used up), or finish."""
+        self.side = 0
+        self.flipped = False
+        if advanced:
+            self.progress += 1
+            self.progress_bar["value"] = self.progress
+            logging.info(f"progress: {self.progress}/{self.total_cards}")
+        if self.deck:
+            self.card_label.config(text=self.deck[0][0])
+            self._show_judgement(False)
+        else:
+            self.change(self.finish)
 
     def on_flip(self) -> None:
-        logging.info("Running...")
         self.flipped = True
         self.side = 1 if self.side == 0 else 0
-        logging.debug(f"self.side = {self.side}")
+        logging.debug("self.side = %s", self.side)
         self.card_label.config(text=self.deck[0][self.side])
-        self.correct_button.grid(row=0, column=0)
-        self.wrong_button.grid(row=0, column=1)
-        logging.info("Done!")
+        self._show_judgement(True)
 
     def on_correct(self) -> None:
-        logging.info("Running...")
-        if self.deck[0] in self.log or (self.deck[0][1], self.deck[0][0]) in self.log:
-            self.log_correct.append(self.deck[0])
-            logging.debug(f"Card {self.deck[0]} added to log_correct.")
-        else:
-            self.log.append(self.deck[0])
-            logging.debug(f"Card {self.deck[0]} added to log.")
-        self.deck.pop(0)
-
-        self.side = 0
-        self.flipped = False
-        self.progress_bar["value"] = int(self.progress_bar["value"]) + 1
-        logging.info(
-            f"progress: {self.progress_bar['value']}/{self.progress_bar['maximum']}"
-        )
-
-        if len(self.deck) > 0:
-            self.card_label.config(text=self.deck[0][0])
-            if not DEV_MODE:
-                self.correct_button.grid_remove()
-                self.wrong_button.grid_remove()
+        card = self.deck.popleft()
+        if card in self.log or (card[1], card[0]) in self.log:
+            self.log_correct.append(card)
+            logging.debug("Card %s added to log_correct.", card)
         else:
-            self.change(self.finish)
-        logging.info("Done!")
+            self.log.add(card)
+            logging.debug("Card %s added to log.", card)
+        self._next_card(advanced=True)
 
     def on_wrong(self) -> None:
-        logging.info("Running...")
-        if not self.settings_var["infinite"].get():
-            self.deck.pop(0)
-            self.progress_bar["value"] = int(self.progress_bar["value"]) + 1
+        if not self.infinite:
+            self.deck.popleft()
         else:
-            self.deck.append(self.deck.pop(0))
-        self.side = 0
-        self.flipped = False
-        if len(self.deck) > 0:
-            self.card_label.config(text=self.deck[0][0])
-            if not DEV_MODE:
-                self.correct_button.grid_remove()
-                self.wrong_button.grid_remove()
-        else:
-            self.change(self.finish)
-        logging.info("Done!")
+            self.deck.rotate(-1)
+        self._next_card(advanced=not self.infinite)
 
     def on_cards_exit(self) -> None:
         logging.info("Running...")
@@ -1173,35 +1473,41 @@ class Menu:
         logging.info("Done!")
 
     def finish(self) -> None:
-        ttk.Label(root, text=self.tr("finish"), font=("Impact", 36)).pack(pady=(20, 25))
-        # total_cards is doubled because of flips; divide by 2 for score denominator
-        denom = max(1, self.total_cards // 2)
-        pct = int((len(self.log_correct) / denom) * 1000) / 10
-        ttk.Label(
-            root,
-            text=f"{self.tr('score')} {len(self.log_correct)}/{denom} ({pct}%)",
-            font=("Arial", 20),
-        ).pack()
+        ttk.Label(self.view, text=self.tr("finish"), style="Title.TLabel").pack(pady=(20, 25))
+        self.score_label = ttk.Label(self.view, font=("Arial", 20))
+        self.score_label.pack()
 
-        navigation_frame = ttk.Frame(root)
+        navigation_frame = ttk.Frame(self.view)
         ttk.Button(navigation_frame, text=self.tr("exit"), command=lambda: self.change(self.main)).grid(row=0, column=0)
         ttk.Button(navigation_frame, text=self.tr("retry"), command=lambda: self.change(self.setup)).grid(row=0, column=1)
         navigation_frame.pack(pady=(25, 0))
 
-        ttk.Label(
-            root,
-            text="Copyright © Raoul van Zomeren. All rights reserved.",
-            font=("Arial", 10, "italic"),
-        ).pack(pady=(10, 0))
+        self.copyright_label()
+
+    def refresh_finish(self) -> None:
+        """Show the score of the round that just ended."""
+        # total_cards is doubled because of flips; divide by 2 for score denominator
+        denom = max(1, self.total_cards // 2)
+        correct: int = len(self.log_correct)
+        pct: float = round(100 * correct / denom, 1)
+        self.score_label.config(text=f"{self.tr('score')} {correct}/{denom} ({pct}%)")
 
     def on_closing(self, force: bool = False) -> None:
         logging.info("Running...")
         if not force:
-            try:
-                with open("settings.json", "w", encoding="utf-8") as f:
-                    json.dump(serialize_settings(self.settings_var), f, indent=4, ensure_ascii=False)
-            except Exception as e:
-                logging.error(f"Failed to save settings: {e}")
+            # Snapshot on the UI thread (Tk variables are not thread-safe), write off it
+            settings: dict | list = serialize_settings(self.settings_var)
+            previous: bytes | None = self._settings_bytes
+
+            def write() -> None:
+                try:
+                    if not _save_settings("settings.json", settings, previous):
+                        logging.info("Settings unchanged, skipped writing settings.json")
+                except Exception as e:
+                    logging.error(f"Failed to save settings: {e}")
+
+            # Non-daemon, so the interpreter still waits for the write after the window is gone
+            threading.Thread(target=write, name="settings-save").start()
         root.destroy()
         logging.info("Done!")
 
@@ -0,0 +1,200 @@
+"""Network, JSON, archive and settings helpers for flashcards.py.
+
+Kept free of a Tk root and of import-time requests so they can be imported (and tested) on their own.
+"""
+from __future__ import annotations
+
+import json, logging, os, shutil, time, typing, zipfile, requests
+import tkinter as tk
+
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, the stdlib json module is the fallback
+    orjson = None  # type: ignore[assignment]
+
+# Keyed on type() rather than isinstance() so bools don't become IntVars
+_CONVERTERS: dict[type, type[tk.Variable]] = {bool: tk.BooleanVar, int: tk.IntVar, str: tk.StringVar}
+
+# One pooled session for every GitHub request, so TCP/TLS connections are reused
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=Retry(total=3, backoff_factor=0.3)))
+
+
+def json_loads(data: bytes | str) -> typing.Any:
+    """Parse JSON with orjson when available."""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def json_dumps(data: typing.Any, pretty: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes with orjson when available.
+
+    The fallback matches orjson's layout (2-space indent, no spaces when compact), so the same data
+    gives the same bytes either way and the unchanged-settings check keeps working.
+    """
+    if orjson:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+    separators: tuple[str, str] = (",", ": ") if pretty else (",", ":")
+    return json.dumps(data, indent=2 if pretty else None, separators=separators, ensure_ascii=False).encode("utf-8")
+
+
+def write_atomic(path: str, payload: bytes) -> None:
+    """Write `payload` to a temp file and swap it in, so a crash never leaves a half-written file."""
+    tmp: str = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(payload)
+    os.replace(tmp, path)
+
+
+def download_range(url: str, path: str, start: int, end: int) -> None:
+    """Fetch bytes `start`..`end` (inclusive) of `url` into the same offsets of the pre-sized file at `path`."""
+    with SESSION.get(url, headers={"Range": f"bytes={start}-{end}"}, stream=True, timeout=60) as r:
+        r.raise_for_status()
+        if r.status_code != 206:
+            raise requests.RequestException(f"Server ignored the range request for bytes {start}-{end}")
+        with open(path, "r+b") as f:
+            f.seek(start)
+            shutil.copyfileobj(r.raw, f, length=1024 * 1024)
+
+
+def conditional_get(url: str, cache_file: str, max_age: float = 0) -> typing.Any:
+    """GET a JSON document, revalidating the copy in `cache_file` with If-None-Match.
+
+    Returns the cached body on 304, or when the request fails and a cached body exists.
+    A cache file touched less than `max_age` seconds ago is returned without any request.
+    """
+    try:
+        with open(cache_file, "rb") as f:
+            cached: dict = json_loads(f.read())
+            age: float = time.time() - os.fstat(f.fileno()).st_mtime
+    except (OSError, json.JSONDecodeError):
+        cached, age = {}, float("inf")
+    has_body: bool = isinstance(cached, dict) and "body" in cached
+    if has_body and age < max_age:
+        return cached["body"]
+
+    headers: dict[str, str] = {"If-None-Match": cached["etag"]} if has_body and cached.get("etag") else {}
+    try:
+        resp: requests.Response = SESSION.get(url, headers=headers, timeout=15)
+        if resp.status_code == 304:
+            try:
+                os.utime(cache_file)  # restart the freshness window without rewriting the body
+            except OSError:
+                pass
+            return cached["body"]
+        resp.raise_for_status()
+        # Decoded inside the try so a non-JSON body (e.g. a captive portal page) also falls back to the cache
+        body = json_loads(resp.content)
+    except (requests.RequestException, json.JSONDecodeError) as e:
+        if not has_body:
+            raise
+        logging.warning(f"Using cached {cache_file}, request failed: {e}")
+        return cached["body"]
+
+    try:
+        write_atomic(cache_file, json_dumps({"etag": resp.headers.get("ETag"), "body": body}))
+    except OSError as e:
+        logging.warning(f"Failed to write {cache_file}: {e}")
+    return body
+
+
+def parse_vakken_zip(archive: zipfile.ZipFile) -> tuple[dict, list[tuple[str, str, str, Exception]]]:
+    """Build the jaar/niveau/vak structure from a Vakken repository zipball.
+
+    Returns the structure and a (jaar, niveau, file, error) entry for every vak file that could not be parsed.
+    """
+    structure: dict = {}
+    skip_list: list[tuple[str, str, str, Exception]] = []
+    for name in archive.namelist():
+        # <owner>-<repo>-<sha>/Vakken/<jaar>/<niveau>/<vak>.json; directory entries end in "/"
+        parts: list[str] = name.rstrip("/").split("/")[1:]
+        if len(parts) < 2 or parts[0] != "Vakken" or not parts[1].startswith("Jaar"):
+            continue
+        if name.endswith("/"):
+            if len(parts) in (2, 3):
+                structure.setdefault(parts[1], {})
+                if len(parts) == 3:
+                    structure[parts[1]].setdefault(parts[2], {})
+        elif len(parts) == 4 and parts[3].endswith(".json"):
+            jn, ln, file = parts[1:]
+            try:
+                contents: dict[str, dict[str, dict[str, str]]] = json_loads(archive.read(name))
+                # Filter out paragraphs lacking a proper _meta dict while the file is parsed
+                vak: dict = {
+                    chapter: {p: data for p, data in paras.items() if isinstance(data.get("_meta"), dict)}
+                    for chapter, paras in contents.items()
+                }
+            except (json.JSONDecodeError, AttributeError) as e:  # AttributeError: not an object of objects
+                skip_list.append((jn, ln, file, e))
+                continue
+            structure.setdefault(jn, {}).setdefault(ln, {})[file[:-5]] = vak  # removes ".json"
+    return structure, skip_list
+
+
+def convert_settings(settings: dict | list, master: tk.Misc | None = None) -> dict | list:
+    """Replace every bool, int and str leaf in `settings` with a Tk variable owned by `master`, in place."""
+    pending: list[dict | list] = [settings]
+    while pending:
+        node = pending.pop()
+        for key, value in list(node.items() if type(node) is dict else enumerate(node)):
+            if type(value) is dict or type(value) is list:
+                pending.append(value)
+            elif (factory := _CONVERTERS.get(type(value))) is not None:
+                node[key] = factory(master, value)
+    return settings
+
+
+def setdefault_advanced(collection: dict | list, key, default_value):
+    """Like dict.setdefault, but merges nested defaults into what is already stored under `key`.
+
+    Missing or None entries and entries that aren't an instance of the default's type are replaced;
+    everything else is kept as it is.
+    """
+    if key not in collection:
+        collection[key] = default_value
+        return default_value
+
+    # Nested defaults are merged with an explicit stack of (parent, key, default) slots
+    pending: list[tuple[dict | list, typing.Any, typing.Any]] = [(collection, key, default_value)]
+    while pending:
+        parent, k, default = pending.pop()
+        current = parent[k]
+        if isinstance(default, dict):
+            if not isinstance(current, dict):
+                parent[k] = default
+                continue
+            for dk, dv in default.items():
+                cur = current.get(dk)
+                if cur is None:
+                    current[dk] = dv
+                elif isinstance(dv, dict) or not isinstance(cur, type(dv)):
+                    pending.append((current, dk, dv))
+        elif not isinstance(current, type(default)):
+            parent[k] = default
+    return collection[key]
+
+
+def serialize_settings(data: dict | list | tk.Variable) -> dict | list:
+    """Turn a settings tree of Tk variables back into plain JSON-ready values."""
+    if type(data) is not dict and type(data) is not list:
+        return typing.cast(dict | list, data.get() if isinstance(data, tk.Variable) else data)
+
+    result: dict | list = type(data)()
+    pending: list[tuple[dict | list, dict | list]] = [(data, result)]
+    while pending:
+        source, target = pending.pop()
+        is_dict: bool = type(target) is dict
+        for key, value in (source.items() if is_dict else enumerate(source)):
+            if type(value) is dict or type(value) is list:
+                # Containers are linked in now and filled when popped, which keeps list order
+                child = type(value)()
+                pending.append((value, child))
+            else:
+                child = value.get() if isinstance(value, tk.Variable) else value
+            if is_dict:
+                target[key] = child  # type: ignore[index]
+            else:
+                target.append(child)  # type: ignore[union-attr]
+    return result
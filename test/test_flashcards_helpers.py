@@ -0,0 +1,155 @@
+import io, json, os, time, zipfile
+
+import pytest, requests
+
+import flashcards_helpers
+from flashcards_helpers import conditional_get, parse_vakken_zip
+
+
+def make_response(status: int, body: bytes = b"", etag: str | None = None) -> requests.Response:
+    resp = requests.Response()
+    resp.status_code = status
+    resp._content = body
+    resp.url = "https://example.invalid/doc.json"
+    if etag:
+        resp.headers["ETag"] = etag
+    return resp
+
+
+class FakeSession:
+    """Stands in for flashcards_helpers.SESSION, recording the headers of every GET."""
+
+    def __init__(self, result: requests.Response | Exception):
+        self.result = result
+        self.calls: list[dict] = []
+
+    def get(self, url, headers=None, timeout=None):
+        self.calls.append(headers or {})
+        if isinstance(self.result, Exception):
+            raise self.result
+        return self.result
+
+
+@pytest.fixture
+def session(monkeypatch):
+    def install(result):
+        fake = FakeSession(result)
+        monkeypatch.setattr(flashcards_helpers, "SESSION", fake)
+        return fake
+    return install
+
+
+def write_cache(path, etag, body, age: float = 0):
+    path.write_text(json.dumps({"etag": etag, "body": body}), encoding="utf-8")
+    stamp = time.time() - age
+    os.utime(path, (stamp, stamp))
+
+
+def test_conditional_get_downloads_and_caches(tmp_path, session):
+    cache = tmp_path / "cache.json"
+    fake = session(make_response(200, b'{"latest": "1.0.2"}', etag='"v1"'))
+
+    assert conditional_get("https://example.invalid", str(cache)) == {"latest": "1.0.2"}
+    assert fake.calls == [{}]
+    assert json.loads(cache.read_bytes()) == {"etag": '"v1"', "body": {"latest": "1.0.2"}}
+
+
+def test_conditional_get_revalidates_with_etag(tmp_path, session):
+    cache = tmp_path / "cache.json"
+    write_cache(cache, '"v1"', ["cached"], age=100)
+    fake = session(make_response(304))
+
+    assert conditional_get("https://example.invalid", str(cache)) == ["cached"]
+    assert fake.calls == [{"If-None-Match": '"v1"'}]
+    assert time.time() - cache.stat().st_mtime < 50  # the 304 restarted the freshness window
+
+
+def test_conditional_get_skips_request_while_fresh(tmp_path, session):
+    cache = tmp_path / "cache.json"
+    write_cache(cache, '"v1"', ["cached"], age=10)
+    fake = session(make_response(200, b'["new"]'))
+
+    assert conditional_get("https://example.invalid", str(cache), max_age=60) == ["cached"]
+    assert fake.calls == []
+
+
+def test_conditional_get_refetches_once_stale(tmp_path, session):
+    cache = tmp_path / "cache.json"
+    write_cache(cache, '"v1"', ["cached"], age=120)
+    session(make_response(200, b'["new"]', etag='"v2"'))
+
+    assert conditional_get("https://example.invalid", str(cache), max_age=60) == ["new"]
+    assert json.loads(cache.read_bytes())["etag"] == '"v2"'
+
+
+@pytest.mark.parametrize("result", [
+    requests.ConnectionError("offline"),
+    make_response(500),
+    make_response(200, b"<html>captive portal</html>"),
+])
+def test_conditional_get_falls_back_to_stale_cache(tmp_path, session, result):
+    cache = tmp_path / "cache.json"
+    write_cache(cache, '"v1"', ["cached"], age=120)
+    session(result)
+
+    assert conditional_get("https://example.invalid", str(cache), max_age=60) == ["cached"]
+
+
+@pytest.mark.parametrize("result, error", [
+    (requests.ConnectionError("offline"), requests.RequestException),
+    (make_response(200, b"<html>captive portal</html>"), json.JSONDecodeError),
+])
+def test_conditional_get_raises_without_cache(tmp_path, session, result, error):
+    session(result)
+    with pytest.raises(error):
+        conditional_get("https://example.invalid", str(tmp_path / "missing.json"))
+
+
+def make_zip(files: dict[str, bytes | None]) -> zipfile.ZipFile:
+    """An in-memory zipball; a None value makes a directory entry."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        for name, data in files.items():
+            archive.writestr(name, b"" if data is None else data)
+    return zipfile.ZipFile(io.BytesIO(buffer.getvalue()))
+
+
+def test_parse_vakken_zip_builds_structure():
+    vak = {
+        "H1": {
+            "1.1": {"_meta": {"flip": True}, "q": "a"},
+            "1.2": {"q": "a"},  # no _meta: dropped
+        },
+    }
+    archive = make_zip({
+        "owner-repo-sha/": None,
+        "owner-repo-sha/README.md": b"# readme",
+        "owner-repo-sha/Vakken/": None,
+        "owner-repo-sha/Vakken/Jaar 1/": None,
+        "owner-repo-sha/Vakken/Jaar 1/havo/": None,
+        "owner-repo-sha/Vakken/Jaar 1/havo/wiskunde.json": json.dumps(vak).encode(),
+        "owner-repo-sha/Vakken/Jaar 2/vwo/": None,
+        "owner-repo-sha/Vakken/Sjablonen/leeg.json": b"{}",
+        "owner-repo-sha/Vakken/Jaar 1/havo/notes.txt": b"not a vak",
+    })
+
+    structure, skipped = parse_vakken_zip(archive)
+
+    assert structure == {
+        "Jaar 1": {"havo": {"wiskunde": {"H1": {"1.1": {"_meta": {"flip": True}, "q": "a"}}}}},
+        "Jaar 2": {"vwo": {}},
+    }
+    assert skipped == []
+
+
+def test_parse_vakken_zip_skips_invalid_files():
+    archive = make_zip({
+        "owner-repo-sha/Vakken/Jaar 1/havo/kapot.json": b"{not json",
+        "owner-repo-sha/Vakken/Jaar 1/havo/lijst.json": b"[1, 2]",
+        "owner-repo-sha/Vakken/Jaar 1/havo/goed.json": b'{"H1": {}}',
+    })
+
+    structure, skipped = parse_vakken_zip(archive)
+
+    assert structure == {"Jaar 1": {"havo": {"goed": {"H1": {}}}}}
+    assert sorted(file for _jn, _ln, file, _e in skipped) == ["kapot.json", "lijst.json"]
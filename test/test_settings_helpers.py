@@ -0,0 +1,78 @@
+import copy
+import tkinter as tk
+
+import pytest
+
+from flashcards_helpers import convert_settings, serialize_settings, setdefault_advanced
+
+
+@pytest.fixture(scope="module")
+def master():
+    # A bare Tcl interpreter is enough to own Tk variables and needs no display
+    return tk.Tcl()
+
+
+def test_setdefault_missing_key(master):
+    settings: dict = {}
+    default = {"theme": tk.StringVar(master, "dark")}
+    assert setdefault_advanced(settings, "general", default) is default
+    assert settings["general"] is default
+
+
+def test_setdefault_nested_defaults(master):
+    kept = tk.BooleanVar(master, False)
+    settings = {"general": {"audio": {"muted": kept}}}
+    default = {
+        "audio": {"muted": tk.BooleanVar(master, True), "volume": tk.IntVar(master, 50)},
+        "language": tk.StringVar(master, "en"),
+    }
+    merged = setdefault_advanced(settings, "general", default)
+    assert merged is settings["general"]
+    assert merged["audio"]["muted"] is kept
+    assert merged["audio"]["volume"] is default["audio"]["volume"]
+    assert merged["language"] is default["language"]
+
+
+def test_setdefault_none_is_replaced(master):
+    default = {"volume": tk.IntVar(master, 50)}
+    settings = {"audio": {"volume": None}}
+    assert setdefault_advanced(settings, "audio", default)["volume"] is default["volume"]
+
+
+def test_setdefault_type_mismatches(master):
+    default = {
+        "flag": tk.BooleanVar(master, True),
+        "group": {"a": tk.IntVar(master, 1)},
+        "count": 3,
+        "ratio": 0.5,
+    }
+    settings = {
+        "s": {
+            "flag": tk.StringVar(master, "yes"),
+            "group": "not a dict",
+            "count": True,
+            "ratio": 2,
+        }
+    }
+    merged = setdefault_advanced(settings, "s", default)
+    assert merged["flag"] is default["flag"]
+    assert merged["group"] is default["group"]
+    # Plain leaves follow isinstance(): a bool is an int, but an int is not a float
+    assert merged["count"] is True
+    assert merged["ratio"] == 0.5
+
+
+def test_convert_serialize_round_trip(master):
+    data = {
+        "general": {"muted": False, "volume": 75, "language": "nl"},
+        "recent": ["b", "a", "c"],
+        "nested": [{"x": 1}, [True, "y"]],
+        "ratio": 0.25,
+    }
+    original = copy.deepcopy(data)
+    converted = convert_settings(data, master)
+    assert converted is data
+    assert isinstance(converted["general"]["muted"], tk.BooleanVar)
+    assert isinstance(converted["general"]["volume"], tk.IntVar)
+    assert isinstance(converted["recent"][0], tk.StringVar)
+    assert serialize_settings(converted) == original